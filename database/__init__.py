@@ -21,6 +21,7 @@ from .models import (
     VendorMapping,
     ProcessingLog,
     DuplicateReview,
+    TransactionAudit,
     Category
 )
 
@@ -40,5 +41,6 @@ __all__ = [
     'VendorMapping',
     'ProcessingLog',
     'DuplicateReview',
+    'TransactionAudit',
     'Category'
 ]
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Cover deleted_at in the category_id index
+
+Revision ID: 28f0999f5129
+Revises: ca192df4b410
+Create Date: 2026-10-16 18:05:19.472906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '28f0999f5129'
+down_revision: Union[str, Sequence[str], None] = 'ca192df4b410'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # get_categories skips soft-deleted rows; with deleted_at included its join
+    # stays an index-only scan. The index is not partial so the foreign key's
+    # ON DELETE SET NULL can still find soft-deleted rows through it.
+    op.drop_index('idx_transactions_category_id', table_name='transactions')
+    op.create_index('idx_transactions_category_id', 'transactions', ['category_id'],
+                    unique=False, postgresql_include=['amount', 'deleted_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_category_id', table_name='transactions')
+    op.create_index('idx_transactions_category_id', 'transactions', ['category_id'],
+                    unique=False, postgresql_include=['amount'])
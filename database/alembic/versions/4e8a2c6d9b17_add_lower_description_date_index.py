@@ -0,0 +1,32 @@
+"""Add expression index on normalised description and date
+
+Revision ID: 4e8a2c6d9b17
+Revises: c71f0b5d2a84
+Create Date: 2026-10-16 13:02:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8a2c6d9b17'
+down_revision: Union[str, Sequence[str], None] = 'c71f0b5d2a84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Must match the LOWER(BTRIM(description)) join key used by find_duplicates
+    op.create_index('idx_transactions_lower_desc_date', 'transactions',
+                    [sa.text('lower(btrim(description))'), 'date'],
+                    unique=False,
+                    postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_lower_desc_date', table_name='transactions')
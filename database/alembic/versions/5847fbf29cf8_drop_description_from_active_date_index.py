@@ -0,0 +1,38 @@
+"""Drop description from the active date covering index
+
+Revision ID: 5847fbf29cf8
+Revises: c0df051ef166
+Create Date: 2026-10-16 17:20:41.684027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5847fbf29cf8'
+down_revision: Union[str, Sequence[str], None] = 'c0df051ef166'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # description and notes are unbounded text; a long value would exceed the
+    # btree row size limit and fail the write, so both are read from the heap
+    op.drop_index('idx_transactions_active_date', table_name='transactions')
+    op.create_index('idx_transactions_active_date', 'transactions', [sa.text('date DESC')],
+                    unique=False,
+                    postgresql_include=['id', 'amount', 'category', 'vendor', 'account'],
+                    postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_active_date', table_name='transactions')
+    op.create_index('idx_transactions_active_date', 'transactions', [sa.text('date DESC')],
+                    unique=False,
+                    postgresql_include=['id', 'description', 'amount', 'category', 'vendor', 'account'],
+                    postgresql_where=sa.text('deleted_at IS NULL'))
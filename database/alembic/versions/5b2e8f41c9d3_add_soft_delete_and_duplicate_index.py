@@ -0,0 +1,39 @@
+"""Add soft-delete columns and duplicate detection index
+
+Revision ID: 5b2e8f41c9d3
+Revises: 0c796c7d330d
+Create Date: 2026-10-16 09:12:44.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8f41c9d3'
+down_revision: Union[str, Sequence[str], None] = '0c796c7d330d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Soft-delete columns used by the MCP management tools
+    op.add_column('transactions', sa.Column('notes', sa.Text(), nullable=True))
+    op.add_column('transactions', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('transactions', sa.Column('deletion_reason', sa.String(length=100), nullable=True))
+    
+    # Date/amount band lookups for the duplicate self-join over active rows
+    op.create_index('idx_transactions_active_date_amount', 'transactions', ['date', 'amount'],
+                    unique=False, postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_active_date_amount', table_name='transactions')
+    
+    op.drop_column('transactions', 'deletion_reason')
+    op.drop_column('transactions', 'deleted_at')
+    op.drop_column('transactions', 'notes')
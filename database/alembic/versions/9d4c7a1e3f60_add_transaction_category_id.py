@@ -0,0 +1,60 @@
+"""Add transactions.category_id foreign key
+
+Revision ID: 9d4c7a1e3f60
+Revises: 5b2e8f41c9d3
+Create Date: 2026-10-16 10:03:27.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c7a1e3f60'
+down_revision: Union[str, Sequence[str], None] = '5b2e8f41c9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('transactions', sa.Column('category_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_transactions_category_id', 'transactions', 'categories',
+                          ['category_id'], ['id'], ondelete='SET NULL')
+    
+    # Backfill from the existing category names
+    op.execute("""
+        UPDATE transactions t
+        SET category_id = c.id
+        FROM categories c
+        WHERE c.name = t.category
+    """)
+    
+    # Keep category_id in sync for every writer that only sets category
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_transaction_category_id() RETURNS trigger AS $$
+        BEGIN
+            NEW.category_id := (SELECT id FROM categories WHERE name = NEW.category);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_transactions_category_id
+        BEFORE INSERT OR UPDATE OF category ON transactions
+        FOR EACH ROW EXECUTE FUNCTION sync_transaction_category_id()
+    """)
+    
+    op.create_index('idx_transactions_category_id', 'transactions', ['category_id'],
+                    unique=False, postgresql_include=['amount'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_category_id', table_name='transactions')
+    op.execute("DROP TRIGGER IF EXISTS trg_transactions_category_id ON transactions")
+    op.execute("DROP FUNCTION IF EXISTS sync_transaction_category_id()")
+    op.drop_constraint('fk_transactions_category_id', 'transactions', type_='foreignkey')
+    op.drop_column('transactions', 'category_id')
@@ -0,0 +1,33 @@
+"""Add partial index over uncategorized active transactions
+
+Revision ID: a3f7d1c85e29
+Revises: 4e8a2c6d9b17
+Create Date: 2026-10-16 13:24:12.604915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f7d1c85e29'
+down_revision: Union[str, Sequence[str], None] = '4e8a2c6d9b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The predicate must stay textually in step with the uncategorized queries
+    # in ManagementTools so the planner can prove they imply it
+    op.create_index('idx_transactions_uncategorized_date', 'transactions', [sa.text('date DESC')],
+                    unique=False,
+                    postgresql_where=sa.text("deleted_at IS NULL AND "
+                                             "(category IS NULL OR category = '' OR category = 'Uncategorized')"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_uncategorized_date', table_name='transactions')
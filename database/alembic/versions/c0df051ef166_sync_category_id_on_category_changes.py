@@ -0,0 +1,56 @@
+"""Sync transactions.category_id when categories are added or renamed
+
+Revision ID: c0df051ef166
+Revises: f3c8e2a9d461
+Create Date: 2026-10-16 16:47:05.129384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0df051ef166'
+down_revision: Union[str, Sequence[str], None] = 'f3c8e2a9d461'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows whose category name only appeared in categories after they were written
+    op.execute("""
+        UPDATE transactions t
+        SET category_id = c.id
+        FROM categories c
+        WHERE c.name = t.category AND t.category_id IS DISTINCT FROM c.id
+    """)
+    
+    # Link transactions to a category added or renamed to their name, and unlink
+    # those still carrying a renamed category's old name
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_category_transactions() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                UPDATE transactions SET category_id = NULL
+                WHERE category_id = NEW.id AND category IS DISTINCT FROM NEW.name;
+            END IF;
+            UPDATE transactions SET category_id = NEW.id
+            WHERE category = NEW.name AND category_id IS DISTINCT FROM NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_categories_sync_transactions
+        AFTER INSERT OR UPDATE OF name ON categories
+        FOR EACH ROW EXECUTE FUNCTION sync_category_transactions()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_categories_sync_transactions ON categories")
+    op.execute("DROP FUNCTION IF EXISTS sync_category_transactions()")
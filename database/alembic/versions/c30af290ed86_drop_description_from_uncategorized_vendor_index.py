@@ -0,0 +1,41 @@
+"""Drop description from the uncategorized vendor index
+
+Revision ID: c30af290ed86
+Revises: 5847fbf29cf8
+Create Date: 2026-10-16 17:34:12.907315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c30af290ed86'
+down_revision: Union[str, Sequence[str], None] = '5847fbf29cf8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNCATEGORIZED_VENDOR_WHERE = ("deleted_at IS NULL AND vendor IS NOT NULL AND vendor <> '' AND "
+                              "(category IS NULL OR category = '' OR category = 'Uncategorized')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # description is unbounded text; a long value on an imported (uncategorized)
+    # row would exceed the btree row size limit, so STRING_AGG reads it from the heap
+    op.drop_index('idx_transactions_uncategorized_vendor', table_name='transactions')
+    op.create_index('idx_transactions_uncategorized_vendor', 'transactions', ['vendor'],
+                    unique=False,
+                    postgresql_include=['amount', 'date'],
+                    postgresql_where=sa.text(UNCATEGORIZED_VENDOR_WHERE))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_uncategorized_vendor', table_name='transactions')
+    op.create_index('idx_transactions_uncategorized_vendor', 'transactions', ['vendor'],
+                    unique=False,
+                    postgresql_include=['description', 'amount', 'date'],
+                    postgresql_where=sa.text(UNCATEGORIZED_VENDOR_WHERE))
@@ -0,0 +1,32 @@
+"""Add covering partial index for pending duplicate reviews
+
+Revision ID: c71f0b5d2a84
+Revises: 9d4c7a1e3f60
+Create Date: 2026-10-16 11:20:05.337419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71f0b5d2a84'
+down_revision: Union[str, Sequence[str], None] = '9d4c7a1e3f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pending rows only, so size tracks the open queue rather than review history
+    op.create_index('idx_duplicate_review_pending', 'duplicate_review', ['group_id', 'transaction_id'],
+                    unique=False,
+                    postgresql_include=['similarity_score', 'notes', 'created_at'],
+                    postgresql_where=sa.text('reviewed = false'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_duplicate_review_pending', table_name='duplicate_review')
@@ -0,0 +1,41 @@
+"""Cover the vendor suggestion fingerprint in the uncategorized vendor index
+
+Revision ID: ca192df4b410
+Revises: c30af290ed86
+Create Date: 2026-10-16 17:52:36.215840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ca192df4b410'
+down_revision: Union[str, Sequence[str], None] = 'c30af290ed86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNCATEGORIZED_VENDOR_WHERE = ("deleted_at IS NULL AND vendor IS NOT NULL AND vendor <> '' AND "
+                              "(category IS NULL OR category = '' OR category = 'Uncategorized')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # id and updated_at let the COUNT/SUM(id)/MAX(updated_at) fingerprint that keys
+    # cached vendor suggestions run as an index-only scan
+    op.drop_index('idx_transactions_uncategorized_vendor', table_name='transactions')
+    op.create_index('idx_transactions_uncategorized_vendor', 'transactions', ['vendor'],
+                    unique=False,
+                    postgresql_include=['amount', 'date', 'id', 'updated_at'],
+                    postgresql_where=sa.text(UNCATEGORIZED_VENDOR_WHERE))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_uncategorized_vendor', table_name='transactions')
+    op.create_index('idx_transactions_uncategorized_vendor', 'transactions', ['vendor'],
+                    unique=False,
+                    postgresql_include=['amount', 'date'],
+                    postgresql_where=sa.text(UNCATEGORIZED_VENDOR_WHERE))
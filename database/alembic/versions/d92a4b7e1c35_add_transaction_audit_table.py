@@ -0,0 +1,39 @@
+"""Add append-only transaction audit table
+
+Revision ID: d92a4b7e1c35
+Revises: b58e0f3a6c41
+Create Date: 2026-10-16 14:38:20.553017
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd92a4b7e1c35'
+down_revision: Union[str, Sequence[str], None] = 'b58e0f3a6c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Deletion notes go here instead of being appended to transactions.notes
+    op.create_table('transaction_audit',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('transaction_id', sa.Integer(), nullable=False),
+        sa.Column('action', sa.String(length=20), nullable=False),
+        sa.Column('note', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_transaction_audit_tx_created', 'transaction_audit',
+                    ['transaction_id', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transaction_audit_tx_created', table_name='transaction_audit')
+    op.drop_table('transaction_audit')
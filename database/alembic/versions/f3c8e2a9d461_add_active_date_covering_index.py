@@ -0,0 +1,32 @@
+"""Add covering index for active transactions by date
+
+Revision ID: f3c8e2a9d461
+Revises: d92a4b7e1c35
+Create Date: 2026-10-16 15:12:48.306712
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8e2a9d461'
+down_revision: Union[str, Sequence[str], None] = 'd92a4b7e1c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Newest-first scans over active rows; notes is left out as it is unbounded text
+    op.create_index('idx_transactions_active_date', 'transactions', [sa.text('date DESC')],
+                    unique=False,
+                    postgresql_include=['id', 'description', 'amount', 'category', 'vendor', 'account'],
+                    postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_active_date', table_name='transactions')
@@ -8,9 +8,10 @@ PostgreSQL backend enables better concurrency, data integrity, and AI integratio
 """
 
 import os
+import re
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Tuple, Union, Iterator
 from decimal import Decimal
 from datetime import datetime, date
 from contextlib import contextmanager
@@ -19,6 +20,7 @@ from sqlalchemy import create_engine, text, and_, or_, func, desc
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import IntegrityError
+import psycopg2.extras
 import pandas as pd
 
 # Import models - handle both package and direct execution
@@ -102,6 +104,60 @@ class DatabaseManager:
             result = session.execute(text(query), params or {})
             return [dict(row._asdict()) for row in result.fetchall()]
     
+    def execute_query(self, query: str, params: Optional[list] = None) -> List[Dict]:
+        """Execute a psycopg2-style (%s) query and commit; return its rows as dictionaries.
+        
+        Statements without a result set (e.g. UPDATE without RETURNING) return an empty list.
+        """
+        with self.raw_transaction(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            cursor.execute(query, params)
+            if cursor.description is None:
+                return []
+            return [dict(row) for row in cursor.fetchall()]
+    
+    @contextmanager
+    def raw_transaction(self, cursor_factory=None):
+        """Context manager yielding a psycopg2 cursor whose statements commit or roll back together."""
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor(cursor_factory=cursor_factory) as cursor:
+                yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+    
+    def execute_values(self, query: str, rows: List[tuple], template: Optional[str] = None,
+                       page_size: int = 1000, cursor=None) -> int:
+        """Execute a multi-row statement (``VALUES %s``) in pages via psycopg2's execute_values.
+        
+        Pass a cursor from raw_transaction() to run inside a larger transaction.
+        """
+        if not rows:
+            return 0
+        
+        if cursor is not None:
+            psycopg2.extras.execute_values(cursor, query, rows, template=template, page_size=page_size)
+        else:
+            with self.raw_transaction() as cursor:
+                psycopg2.extras.execute_values(cursor, query, rows, template=template, page_size=page_size)
+        return len(rows)
+    
+    def stream_query(self, query: str, params: Optional[list] = None, itersize: int = 500) -> Iterator[Dict]:
+        """Yield query rows as dictionaries from a server-side cursor, itersize rows per fetch."""
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor(name='stream_query', cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, params)
+                for row in cursor:
+                    yield dict(row)
+            connection.commit()
+        finally:
+            connection.close()
+    
     def create_tables(self):
         """Create all tables using SQLAlchemy models (deprecated - use migrations)."""
         logger.warning("create_tables() is deprecated. Use run_migrations() instead.")
@@ -181,6 +237,21 @@ class DatabaseManager:
 class TransactionOperations:
     """High-level operations for transaction management using SQLAlchemy ORM."""
     
+    # Whitelisted sort keys for get_transactions
+    SORT_COLUMNS = {
+        'date': Transaction.date,
+        'amount': Transaction.amount,
+        'category': Transaction.category,
+    }
+    
+    # Data columns insert_transactions_batch writes; the rest of the table is
+    # managed by the database (id, timestamps, category_id trigger) or soft deletes
+    IMPORT_COLUMNS = (
+        'date', 'description', 'amount', 'category', 'vendor', 'source', 'txn_id',
+        'reference', 'account', 'balance', 'original_hash', 'possible_dup_group',
+        'row_hash', 'time_part', 'notes'
+    )
+    
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
     
@@ -193,39 +264,93 @@ class TransactionOperations:
             return transaction.id
     
     def insert_transactions_batch(self, transactions: List[Dict[str, Any]]) -> int:
-        """Insert multiple transactions in a batch operation."""
+        """Insert multiple transactions as paged multi-row INSERTs in one transaction."""
         if not transactions:
             return 0
         
-        with self.db.get_session() as session:
-            transaction_objects = [Transaction(**t) for t in transactions]
-            session.add_all(transaction_objects)
-            return len(transaction_objects)
+        # Managed columns are dropped so a stray id or timestamp cannot override
+        # the sequence or server defaults; anything else unknown is rejected
+        keys = list(dict.fromkeys(key for t in transactions for key in t))
+        unknown = [k for k in keys if k not in Transaction.__table__.columns]
+        if unknown:
+            raise ValueError(f"Unknown transaction fields: {', '.join(unknown)}")
+        columns = [k for k in keys if k in self.IMPORT_COLUMNS]
+        if not columns:
+            raise ValueError("No importable transaction fields")
+        
+        rows = [tuple(t.get(c) for c in columns) for t in transactions]
+        query = (f"INSERT INTO transactions ({', '.join(columns)}, created_at, updated_at) "
+                 f"VALUES %s")
+        template = f"({', '.join(['%s'] * len(columns))}, NOW(), NOW())"
+        return self.db.execute_values(query, rows, template=template, page_size=1000)
+    
+    @staticmethod
+    def _filter_transactions(query,
+                             start_date: Optional[date] = None,
+                             end_date: Optional[date] = None,
+                             category: Optional[str] = None,
+                             vendor: Optional[str] = None,
+                             min_amount: Optional[Decimal] = None,
+                             max_amount: Optional[Decimal] = None,
+                             description_search: Optional[str] = None):
+        """Apply the optional transaction filters shared by the listing and totals queries."""
+        # Soft-deleted rows are hidden from listings and reports
+        query = query.filter(Transaction.deleted_at.is_(None))
+        
+        if start_date:
+            query = query.filter(Transaction.date >= start_date)
+        
+        if end_date:
+            query = query.filter(Transaction.date <= end_date)
+        
+        if category:
+            query = query.filter(Transaction.category == category)
+        
+        if vendor:
+            query = query.filter(Transaction.vendor.ilike(f"%{vendor}%"))
+        
+        if min_amount is not None:
+            query = query.filter(Transaction.amount >= min_amount)
+        
+        if max_amount is not None:
+            query = query.filter(Transaction.amount <= max_amount)
+        
+        if description_search:
+            # Literal substring match: % and _ in the search term are escaped
+            query = query.filter(Transaction.description.icontains(description_search, autoescape=True))
+        
+        return query
     
     def get_transactions(self, 
                         start_date: Optional[date] = None,
                         end_date: Optional[date] = None,
                         category: Optional[str] = None,
                         vendor: Optional[str] = None,
-                        limit: Optional[int] = None) -> List[Dict]:
-        """Get transactions with optional filtering."""
+                        limit: Optional[int] = None,
+                        min_amount: Optional[Decimal] = None,
+                        max_amount: Optional[Decimal] = None,
+                        description_search: Optional[str] = None,
+                        sort_by: str = 'date',
+                        sort_order: str = 'desc') -> List[Dict]:
+        """Get transactions with optional filtering, sorted and limited in SQL."""
         
         with self.db.get_session() as session:
-            query = session.query(Transaction)
-            
-            if start_date:
-                query = query.filter(Transaction.date >= start_date)
-            
-            if end_date:
-                query = query.filter(Transaction.date <= end_date)
-            
-            if category:
-                query = query.filter(Transaction.category == category)
+            query = self._filter_transactions(
+                session.query(Transaction), start_date, end_date, category, vendor,
+                min_amount, max_amount, description_search
+            )
             
-            if vendor:
-                query = query.filter(Transaction.vendor.ilike(f"%{vendor}%"))
+            if sort_by not in self.SORT_COLUMNS:
+                raise ValueError(f"Invalid sort_by '{sort_by}'. Use one of: {', '.join(self.SORT_COLUMNS)}")
+            if sort_order not in ('asc', 'desc'):
+                raise ValueError(f"Invalid sort_order '{sort_order}'. Use 'asc' or 'desc'")
             
-            query = query.order_by(desc(Transaction.date), desc(Transaction.id))
+            # Rows without a value (e.g. uncategorized) always sort last
+            sort_column = self.SORT_COLUMNS[sort_by]
+            if sort_order == 'asc':
+                query = query.order_by(sort_column.asc().nulls_last(), Transaction.id.asc())
+            else:
+                query = query.order_by(sort_column.desc().nulls_last(), Transaction.id.desc())
             
             if limit:
                 query = query.limit(limit)
@@ -233,6 +358,28 @@ class TransactionOperations:
             results = query.all()
             return [self._transaction_to_dict(t) for t in results]
     
+    def get_transaction_totals(self,
+                               start_date: Optional[date] = None,
+                               end_date: Optional[date] = None,
+                               category: Optional[str] = None,
+                               vendor: Optional[str] = None,
+                               min_amount: Optional[Decimal] = None,
+                               max_amount: Optional[Decimal] = None,
+                               description_search: Optional[str] = None) -> Dict[str, Any]:
+        """Get count, net total, income and expenses over all transactions matching the filters."""
+        
+        with self.db.get_session() as session:
+            query = self._filter_transactions(
+                session.query(
+                    func.count(Transaction.id).label('count'),
+                    func.coalesce(func.sum(Transaction.amount), 0).label('total'),
+                    func.coalesce(func.sum(Transaction.amount).filter(Transaction.amount > 0), 0).label('income'),
+                    func.coalesce(func.sum(-Transaction.amount).filter(Transaction.amount < 0), 0).label('expenses')
+                ),
+                start_date, end_date, category, vendor, min_amount, max_amount, description_search
+            )
+            return dict(query.one()._asdict())
+    
     def get_uncategorized_transactions(self, limit: Optional[int] = None) -> List[Dict]:
         """Get transactions that need categorization."""
         with self.db.get_session() as session:
@@ -321,6 +468,9 @@ class VendorMappingOperations:
     
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
+        self._compiled_rules: Optional[List[Tuple[re.Pattern, str]]] = None
+        self._grouped_rules: List[Tuple[re.Pattern, str]] = []
+        self._compiled_union: Optional[re.Pattern] = None
     
     def add_vendor_mapping(self, vendor_pattern: str, category: str, 
                           is_regex: bool = False, priority: int = 0) -> int:
@@ -334,7 +484,10 @@ class VendorMappingOperations:
             )
             session.add(mapping)
             session.flush()
-            return mapping.id
+            mapping_id = mapping.id
+        
+        self.invalidate_compiled_rules()
+        return mapping_id
     
     def get_vendor_mappings(self) -> List[Dict]:
         """Get all vendor mapping rules ordered by priority."""
@@ -348,21 +501,68 @@ class VendorMappingOperations:
     
     def find_category_for_vendor(self, vendor_name: str) -> Optional[str]:
         """Find the best matching category for a vendor name."""
-        mappings = self.get_vendor_mappings()
+        union = self.get_compiled_union()
+        rules = self._compiled_rules
         
-        for mapping in mappings:
-            pattern = mapping['vendor_pattern']
-            
-            if mapping['is_regex']:
-                import re
-                if re.search(pattern, vendor_name, re.IGNORECASE):
-                    return mapping['category']
-            else:
-                if pattern.lower() in vendor_name.lower():
-                    return mapping['category']
+        # Most vendors match no rule; one pass over the combined pattern rules out
+        # every group-free rule, leaving only the rules kept out of the union
+        if union is not None and not union.search(vendor_name):
+            rules = self._grouped_rules
+        
+        for pattern, category in rules:
+            if pattern.search(vendor_name):
+                return category
         
         return None
     
+    def get_compiled_union(self) -> Optional[re.Pattern]:
+        """Get the group-free mapping patterns compiled into a single case-insensitive alternation.
+        
+        Used as a pre-filter only: the alternation reports whether any group-free rule
+        matches, while rule priority is still resolved per rule by find_category_for_vendor.
+        """
+        if self._compiled_rules is None:
+            self._compile_rules()
+        return self._compiled_union
+    
+    def invalidate_compiled_rules(self):
+        """Discard compiled patterns so they are rebuilt from the database on next use."""
+        self._compiled_rules = None
+        self._grouped_rules = []
+        self._compiled_union = None
+    
+    def _compile_rules(self):
+        """Compile each mapping in priority order, plus the alternation of group-free rules."""
+        rules = []
+        for mapping in self.get_vendor_mappings():
+            pattern = mapping['vendor_pattern']
+            source = pattern if mapping['is_regex'] else re.escape(pattern)
+            try:
+                rules.append((re.compile(source, re.IGNORECASE), mapping['category']))
+            except re.error as e:
+                logger.warning(f"Skipping invalid vendor mapping {mapping['id']} ('{pattern}'): {e}")
+        
+        # Combining patterns renumbers their groups, so a backreference or conditional
+        # would silently point at another rule's group; rules with groups stay out
+        grouped_rules = [(rule, category) for rule, category in rules if rule.groups]
+        
+        # Anchored alternatives first, then longest first so specific patterns are tried early
+        sources = sorted(
+            {rule.pattern for rule, _ in rules if not rule.groups},
+            key=lambda src: (not src.startswith('^'), -len(src))
+        )
+        union = None
+        if sources:
+            try:
+                union = re.compile('|'.join(f"(?:{src})" for src in sources), re.IGNORECASE)
+            except re.error:
+                # e.g. a global inline flag that is only valid at the start of a pattern
+                union = None
+        
+        self._compiled_rules = rules
+        self._grouped_rules = grouped_rules
+        self._compiled_union = union
+    
     def _mapping_to_dict(self, mapping: VendorMapping) -> Dict:
         """Convert a VendorMapping object to a dictionary."""
         return {
@@ -13,7 +13,7 @@ from decimal import Decimal
 from sqlalchemy import (
     Column, Integer, String, Text, Date, DECIMAL, Boolean, 
     DateTime, ForeignKey, CheckConstraint, UniqueConstraint,
-    Index, func
+    Index, func, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -32,6 +32,7 @@ class Transaction(Base):
     description = Column(Text, nullable=False)
     amount = Column(DECIMAL(10, 2), nullable=False)
     category = Column(String(50))
+    category_id = Column(Integer, ForeignKey('categories.id', name='fk_transactions_category_id', ondelete='SET NULL'))  # Kept in sync with category by trigger
     vendor = Column(String(200))
     source = Column(String(100))
     txn_id = Column(String(100))
@@ -42,6 +43,9 @@ class Transaction(Base):
     possible_dup_group = Column(String(20))
     row_hash = Column(String(32), unique=True, nullable=False)
     time_part = Column(String(10))  # For time component if available
+    notes = Column(Text)
+    deleted_at = Column(DateTime)  # Soft delete marker, NULL for active rows
+    deletion_reason = Column(String(100))
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
@@ -67,6 +71,27 @@ class Transaction(Base):
         Index('idx_transactions_date_amount', 'date', 'amount'),
         Index('idx_transactions_vendor_category', 'vendor', 'category'),
         Index('idx_transactions_txn_id_account', 'txn_id', 'account'),
+        
+        # Covering index for per-category aggregates
+        Index('idx_transactions_category_id', 'category_id', postgresql_include=['amount', 'deleted_at']),
+        
+        # Partial indexes over active (not soft-deleted) rows
+        Index('idx_transactions_active_date_amount', 'date', 'amount',
+              postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_transactions_active_date', 'date',
+              postgresql_using='btree', postgresql_ops={'date': 'DESC'},
+              postgresql_include=['id', 'amount', 'category', 'vendor', 'account'],
+              postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_transactions_lower_desc_date', text('lower(btrim(description))'), 'date',
+              postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_transactions_uncategorized_date', 'date',
+              postgresql_using='btree', postgresql_ops={'date': 'DESC'},
+              postgresql_where=text("deleted_at IS NULL AND "
+                                    "(category IS NULL OR category = '' OR category = 'Uncategorized')")),
+        Index('idx_transactions_uncategorized_vendor', 'vendor',
+              postgresql_include=['amount', 'date', 'id', 'updated_at'],
+              postgresql_where=text("deleted_at IS NULL AND vendor IS NOT NULL AND vendor <> '' AND "
+                                    "(category IS NULL OR category = '' OR category = 'Uncategorized')")),
     )
     
     def __repr__(self):
@@ -157,12 +182,38 @@ class DuplicateReview(Base):
     __table_args__ = (
         Index('idx_duplicate_review_group', 'group_id'),
         Index('idx_duplicate_review_reviewed', 'reviewed'),
+        
+        # Covering partial index for the pending review queue
+        Index('idx_duplicate_review_pending', 'group_id', 'transaction_id',
+              postgresql_include=['similarity_score', 'notes', 'created_at'],
+              postgresql_where=text('reviewed = false')),
     )
     
     def __repr__(self):
         return f"<DuplicateReview(id={self.id}, group_id='{self.group_id}', transaction_id={self.transaction_id}, reviewed={self.reviewed})>"
 
 
+class TransactionAudit(Base):
+    """Append-only audit trail of changes made to transactions."""
+    
+    __tablename__ = 'transaction_audit'
+    
+    id = Column(Integer, primary_key=True)
+    transaction_id = Column(Integer, nullable=False)  # No FK so entries outlive permanent deletes
+    action = Column(String(20), nullable=False)  # 'soft_delete', 'delete'
+    note = Column(Text)
+    created_at = Column(DateTime, server_default=func.now())  # Rows are written by raw SQL
+    
+    # Indexes
+    __table_args__ = (
+        Index('idx_transaction_audit_tx_created', 'transaction_id', 'created_at',
+              postgresql_using='btree', postgresql_ops={'created_at': 'DESC'}),
+    )
+    
+    def __repr__(self):
+        return f"<TransactionAudit(id={self.id}, transaction_id={self.transaction_id}, action='{self.action}')>"
+
+
 class Category(Base):
     """Master list of valid expense/income categories."""
     
@@ -95,7 +95,11 @@ def test_database_connection():
         health = db_manager.get_database_health()
         if health.get('connected'):
             print("✅ Database connection successful")
-            print(f"📊 Found {health.get('total_transactions', 0)} transactions")
+            estimated = health.get('estimated_transactions')
+            if estimated is None:
+                print("📊 Transaction count not estimated yet (run ANALYZE transactions)")
+            else:
+                print(f"📊 About {estimated:,} transactions (planner estimate)")
             return True
         else:
             print(f"❌ Database connection failed: {health.get('error', 'Unknown error')}")
@@ -4,9 +4,17 @@ Management Tools for MCP Server
 Provides database management, configuration, and maintenance tools.
 """
 
-from typing import List, Dict, Any, Optional
+import io
+import re
+import time
+from collections import defaultdict
+from decimal import Decimal
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pydantic import BaseModel, Field
 
+# Seconds before cached vendor mappings and category names are reloaded
+LOOKUP_CACHE_TTL = 60
+
 class UpdateVendorMappingParams(BaseModel):
     """Parameters for updating vendor mappings."""
     vendor_pattern: str = Field(..., description="Vendor name pattern to match")
@@ -19,6 +27,7 @@ class StageDuplicatesParams(BaseModel):
     days_back: Optional[int] = Field(30, description="Look for duplicates in last N days")
     amount_tolerance: Optional[float] = Field(0.01, description="Amount difference tolerance")
     auto_stage: Optional[bool] = Field(True, description="Automatically stage high-confidence duplicates")
+    clear_previous: Optional[bool] = Field(True, description="Replace pending (unreviewed) groups instead of adding to them")
 
 class ReviewDuplicateParams(BaseModel):
     """Parameters for reviewing a duplicate transaction pair."""
@@ -27,6 +36,11 @@ class ReviewDuplicateParams(BaseModel):
     keep_transaction_id: Optional[int] = Field(None, description="Which transaction to keep (required for delete_duplicate)")
     notes: Optional[str] = Field("", description="Notes about the decision")
 
+class DuplicateReviewQueueParams(BaseModel):
+    """Parameters for paging through the duplicate review queue."""
+    limit: Optional[int] = Field(50, description="Maximum number of duplicate groups to show")
+    offset: Optional[int] = Field(0, description="Number of duplicate groups to skip")
+
 class DeleteTransactionParams(BaseModel):
     """Parameters for deleting a transaction."""
     transaction_id: int = Field(..., description="ID of transaction to delete")
@@ -41,6 +55,59 @@ class ManagementTools:
         self.db_manager = db_manager
         self.vendor_ops = db_manager.get_vendor_operations()
         self.db = db_manager.get_core_db()
+        self._mapping_cache: Dict[str, Tuple[float, Any]] = {}
+        self._report_cache: Dict[str, Tuple[Tuple, str]] = {}
+    
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return a cached lookup, reloading it once it is older than LOOKUP_CACHE_TTL."""
+        now = time.monotonic()
+        entry = self._mapping_cache.get(key)
+        if entry is not None and now - entry[0] < LOOKUP_CACHE_TTL:
+            return entry[1]
+        
+        value = loader()
+        self._mapping_cache[key] = (now, value)
+        return value
+    
+    def _invalidate_cache(self):
+        """Drop cached lookups after a write to vendor mappings or categories."""
+        self._mapping_cache.clear()
+    
+    def _get_vendor_mappings(self) -> List[Dict]:
+        """Get vendor mapping rules, cached."""
+        return self._cached('vendor_mappings', self.vendor_ops.get_vendor_mappings)
+    
+    def _get_active_category_names(self) -> frozenset:
+        """Get names of active categories as a set, cached."""
+        def load():
+            rows = self.db.execute_query("SELECT name FROM categories WHERE is_active = true")
+            return frozenset(row['name'] for row in rows)
+        return self._cached('active_category_names', load)
+    
+    def _resolve_category(self, name: str) -> Optional[str]:
+        """Return the canonical active category for name, matching case-insensitively."""
+        names = self._get_active_category_names()
+        if name in names:
+            return name
+        by_lower = self._cached('active_category_lower',
+                                lambda: {n.lower(): n for n in names})
+        return by_lower.get(name.lower())
+    
+    def _vendor_suggestion_fingerprint(self) -> Tuple:
+        """Probe of the uncategorized rows with a vendor, used to key cached vendor suggestions.
+        
+        The predicate and columns are all covered by idx_transactions_uncategorized_vendor,
+        so this is an index-only scan rather than the heap reads of the suggestion query.
+        """
+        row = self.db.execute_query("""
+        SELECT COUNT(*) AS n, SUM(id) AS id_sum, MAX(updated_at) AS last_update
+        FROM transactions
+        WHERE (category IS NULL OR category = '' OR category = 'Uncategorized')
+        AND vendor IS NOT NULL
+        AND vendor != ''
+        AND deleted_at IS NULL
+        """)[0]
+        return (row['n'], row['id_sum'], row['last_update'])
     
     def get_categories(self) -> str:
         """
@@ -50,13 +117,14 @@ class ManagementTools:
         including their descriptions and current usage statistics.
         """
         try:
-            # Get categories from database
+            # Get categories with usage over active rows; every transactions column
+            # used here is in idx_transactions_category_id, so the join is index-only
             categories_query = """
             SELECT c.name, c.description, c.sort_order,
-                   COUNT(t.id) as transaction_count,
+                   COUNT(t.category_id) as transaction_count,
                    COALESCE(SUM(ABS(t.amount)), 0) as total_amount
             FROM categories c
-            LEFT JOIN transactions t ON c.name = t.category
+            LEFT JOIN transactions t ON t.category_id = c.id AND t.deleted_at IS NULL
             WHERE c.is_active = true
             GROUP BY c.id, c.name, c.description, c.sort_order
             ORDER BY c.sort_order, c.name
@@ -66,32 +134,32 @@ class ManagementTools:
             if not categories:
                 return "No categories found in the database."
             
-            response = "📂 Available Categories:\n\n"
+            parts = ["📂 Available Categories:\n\n"]
             
             total_transactions = sum(cat['transaction_count'] for cat in categories)
             total_amount = sum(float(cat['total_amount']) for cat in categories)
             
             for cat in categories:
-                response += f"• **{cat['name']}**"
+                parts.append(f"• **{cat['name']}**")
                 if cat.get('description'):
-                    response += f" - {cat['description']}"
+                    parts.append(f" - {cat['description']}")
                 
                 tx_count = cat['transaction_count']
                 amount = float(cat['total_amount'])
                 
                 if tx_count > 0:
-                    response += f"\n  📊 {tx_count:,} transactions | ${amount:,.2f}"
+                    parts.append(f"\n  📊 {tx_count:,} transactions | ${amount:,.2f}")
                     if total_transactions > 0:
                         percentage = (tx_count / total_transactions * 100)
-                        response += f" ({percentage:.1f}%)"
+                        parts.append(f" ({percentage:.1f}%)")
                 else:
-                    response += "\n  📊 No transactions yet"
+                    parts.append("\n  📊 No transactions yet")
                 
-                response += "\n\n"
+                parts.append("\n\n")
             
-            response += f"📈 Summary: {len(categories)} categories | {total_transactions:,} total transactions | ${total_amount:,.2f} total amount"
+            parts.append(f"📈 Summary: {len(categories)} categories | {total_transactions:,} total transactions | ${total_amount:,.2f} total amount")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error getting categories: {str(e)}"
@@ -104,16 +172,22 @@ class ManagementTools:
         vendor names or description patterns. Helps automate future categorization.
         """
         try:
-            # Validate category exists
-            valid_categories_query = "SELECT name FROM categories WHERE is_active = true"
-            valid_categories = self.db.execute_query(valid_categories_query)
-            valid_category_names = [cat['name'] for cat in valid_categories]
+            # Reject invalid regex rules before they reach the categorizer
+            if params.is_regex:
+                try:
+                    re.compile(params.vendor_pattern)
+                except re.error as e:
+                    return f"Error: '{params.vendor_pattern}' is not a valid regular expression: {e}"
+            
+            # Validate category exists (case-insensitively) and use its stored spelling
+            category = self._resolve_category(params.category)
             
-            if params.category not in valid_category_names:
-                return f"Error: '{params.category}' is not a valid category.\n\nValid categories: {', '.join(valid_category_names)}"
+            if category is None:
+                return f"Error: '{params.category}' is not a valid category.\n\nValid categories: {', '.join(sorted(self._get_active_category_names()))}"
+            params.category = category
             
             # Check if similar mapping already exists
-            existing_mappings = self.vendor_ops.get_vendor_mappings()
+            existing_mappings = self._get_vendor_mappings()
             similar_mappings = [
                 m for m in existing_mappings 
                 if m['vendor_pattern'].lower() == params.vendor_pattern.lower()
@@ -130,18 +204,19 @@ class ManagementTools:
                 is_regex=params.is_regex,
                 priority=params.priority
             )
+            self._invalidate_cache()
             
-            response = f"✅ Vendor mapping added successfully!\n\n"
-            response += f"🆔 Mapping ID: {mapping_id}\n"
-            response += f"🏪 Pattern: '{params.vendor_pattern}'\n"
-            response += f"📂 Category: {params.category}\n"
-            response += f"🔤 Regex: {'Yes' if params.is_regex else 'No'}\n"
-            response += f"⚡ Priority: {params.priority}\n\n"
+            parts = [f"✅ Vendor mapping added successfully!\n\n"]
+            parts.append(f"🆔 Mapping ID: {mapping_id}\n")
+            parts.append(f"🏪 Pattern: '{params.vendor_pattern}'\n")
+            parts.append(f"📂 Category: {params.category}\n")
+            parts.append(f"🔤 Regex: {'Yes' if params.is_regex else 'No'}\n")
+            parts.append(f"⚡ Priority: {params.priority}\n\n")
             
-            response += "💡 This rule will automatically categorize future transactions that match the pattern.\n"
-            response += "To apply to existing transactions, run the AI categorization process."
+            parts.append("💡 This rule will automatically categorize future transactions that match the pattern.\n")
+            parts.append("To apply to existing transactions, run the AI categorization process.")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error updating vendor mapping: {str(e)}"
@@ -154,42 +229,39 @@ class ManagementTools:
         showing their patterns, categories, and priorities.
         """
         try:
-            mappings = self.vendor_ops.get_vendor_mappings()
+            mappings = self._get_vendor_mappings()
             
             if not mappings:
                 return "No vendor mapping rules found.\n\nUse 'update_vendor_mapping' to create automatic categorization rules."
             
-            response = f"🏪 Vendor Mapping Rules ({len(mappings)} total):\n\n"
+            parts = [f"🏪 Vendor Mapping Rules ({len(mappings)} total):\n\n"]
             
             # Group by priority for better organization
-            priority_groups = {}
+            priority_groups = defaultdict(list)
             for mapping in mappings:
-                priority = mapping['priority']
-                if priority not in priority_groups:
-                    priority_groups[priority] = []
-                priority_groups[priority].append(mapping)
+                priority_groups[mapping['priority']].append(mapping)
             
             # Sort by priority (highest first)
-            for priority in sorted(priority_groups.keys(), reverse=True):
+            for priority in sorted(priority_groups, reverse=True):
                 if priority > 0:
-                    response += f"⚡ Priority {priority}:\n"
+                    parts.append(f"⚡ Priority {priority}:\n")
                 elif priority == 0:
-                    response += f"📋 Standard Priority:\n"
+                    parts.append(f"📋 Standard Priority:\n")
                 else:
-                    response += f"🔽 Low Priority ({priority}):\n"
+                    parts.append(f"🔽 Low Priority ({priority}):\n")
                 
                 for mapping in priority_groups[priority]:
-                    response += f"  • '{mapping['vendor_pattern']}' → {mapping['category']}"
+                    parts.append(f"  • '{mapping['vendor_pattern']}' → {mapping['category']}")
                     if mapping['is_regex']:
-                        response += " (regex)"
-                    response += f" [ID: {mapping['id']}]\n"
+                        parts.append(" (regex)")
+                    parts.append(f" [ID: {mapping['id']}]\n")
                 
-                response += "\n"
+                parts.append("\n")
             
-            response += "💡 Rules are applied in priority order (highest first).\n"
-            response += "💡 Use 'update_vendor_mapping' to add new rules."
+            parts.append("💡 Rules are applied in priority order (highest first).\n")
+            parts.append("💡 Use 'update_vendor_mapping' to add new rules.")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error getting vendor mappings: {str(e)}"
@@ -202,101 +274,98 @@ class ManagementTools:
         categorization progress, date ranges, and system health.
         """
         try:
-            # Get database health information
-            health = self.db_manager.get_database_health()
-            
-            if not health.get('connected'):
-                return f"❌ Database connection failed: {health.get('error', 'Unknown error')}"
+            # Gather every statistic in one round trip; transaction metrics share one scan
+            stats_query = """
+            SELECT version() AS postgres_version,
+                   to_regclass('transactions') IS NOT NULL AS has_transactions,
+                   to_regclass('categories') IS NOT NULL AS has_categories,
+                   to_regclass('vendor_mappings') IS NOT NULL AS has_vendor_mappings,
+                   to_regclass('processing_log') IS NOT NULL AS has_processing_log,
+                   tx.*,
+                   (SELECT COUNT(*) FROM categories WHERE is_active = true) AS total_categories,
+                   (SELECT COUNT(*) FROM vendor_mappings) AS total_vendor_mappings
+            FROM (
+                SELECT COUNT(*) FILTER (WHERE deleted_at IS NULL) AS total_transactions,
+                       COUNT(*) FILTER (
+                           WHERE deleted_at IS NULL
+                           AND (category IS NULL OR category = '' OR category = 'Uncategorized')
+                       ) AS uncategorized_transactions,
+                       COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '7 days') AS recent_transactions,
+                       MIN(date) FILTER (WHERE deleted_at IS NULL) AS earliest,
+                       MAX(date) FILTER (WHERE deleted_at IS NULL) AS latest
+                FROM transactions
+            ) tx
+            """
+            health = self.db.execute_query(stats_query)[0]
             
-            response = "📊 Database Statistics & Health Report\n\n"
+            parts = ["📊 Database Statistics & Health Report\n\n"]
             
             # Connection info
-            response += "🔗 Connection Status:\n"
-            response += f"  ✅ Connected to PostgreSQL\n"
-            if 'postgres_version' in health:
-                response += f"  📍 Version: {health['postgres_version']}\n"
-            response += "\n"
+            parts.append("🔗 Connection Status:\n")
+            parts.append(f"  ✅ Connected to PostgreSQL\n")
+            parts.append(f"  📍 Version: {health['postgres_version']}\n")
+            parts.append("\n")
             
             # Table status
-            if 'tables_exist' in health:
-                response += "🗃️ Database Schema:\n"
-                tables = health['tables_exist']
-                for table, exists in tables.items():
-                    status = "✅" if exists else "❌"
-                    response += f"  {status} {table}\n"
-                response += "\n"
+            parts.append("🗃️ Database Schema:\n")
+            for table in ('transactions', 'categories', 'vendor_mappings', 'processing_log'):
+                status = "✅" if health[f"has_{table}"] else "❌"
+                parts.append(f"  {status} {table}\n")
+            parts.append("\n")
             
             # Transaction statistics
-            response += "📈 Transaction Statistics:\n"
-            response += f"  📊 Total Transactions: {health.get('total_transactions', 0):,}\n"
+            parts.append("📈 Transaction Statistics:\n")
+            parts.append(f"  📊 Total Transactions: {health['total_transactions']:,}\n")
             
-            categorized_count = health['total_transactions'] - health.get('uncategorized_transactions', 0)
-            response += f"  ✅ Categorized: {categorized_count:,}\n"
-            response += f"  ❓ Uncategorized: {health.get('uncategorized_transactions', 0):,}\n"
+            categorized_count = health['total_transactions'] - health['uncategorized_transactions']
+            parts.append(f"  ✅ Categorized: {categorized_count:,}\n")
+            parts.append(f"  ❓ Uncategorized: {health['uncategorized_transactions']:,}\n")
             
             if health['total_transactions'] > 0:
                 categorized_pct = (categorized_count / health['total_transactions'] * 100)
-                response += f"  📊 Categorization Rate: {categorized_pct:.1f}%\n"
+                parts.append(f"  📊 Categorization Rate: {categorized_pct:.1f}%\n")
             
-            response += "\n"
+            parts.append("\n")
             
             # Date range information
-            if health.get('date_range'):
-                date_info = health['date_range']
-                response += "📅 Data Coverage:\n"
-                response += f"  📅 Earliest Transaction: {date_info.get('earliest', 'N/A')}\n"
-                response += f"  📅 Latest Transaction: {date_info.get('latest', 'N/A')}\n"
+            if health['earliest'] and health['latest']:
+                parts.append("📅 Data Coverage:\n")
+                parts.append(f"  📅 Earliest Transaction: {health['earliest']}\n")
+                parts.append(f"  📅 Latest Transaction: {health['latest']}\n")
                 
-                if date_info.get('earliest') and date_info.get('latest'):
-                    from datetime import datetime
-                    try:
-                        earliest = datetime.strptime(str(date_info['earliest']), '%Y-%m-%d').date()
-                        latest = datetime.strptime(str(date_info['latest']), '%Y-%m-%d').date()
-                        days_span = (latest - earliest).days
-                        response += f"  📊 Data Span: {days_span} days\n"
-                    except:
-                        pass
+                # psycopg2 already returns DATE columns as datetime.date
+                days_span = (health['latest'] - health['earliest']).days
+                parts.append(f"  📊 Data Span: {days_span} days\n")
                 
-                response += "\n"
+                parts.append("\n")
             
             # Category and mapping statistics
-            response += "📂 Configuration:\n"
-            response += f"  📂 Categories: {health.get('total_categories', 0)}\n"
-            response += f"  🏪 Vendor Mappings: {health.get('total_vendor_mappings', 0)}\n"
-            response += "\n"
+            parts.append("📂 Configuration:\n")
+            parts.append(f"  📂 Categories: {health['total_categories']}\n")
+            parts.append(f"  🏪 Vendor Mappings: {health['total_vendor_mappings']}\n")
+            parts.append("\n")
             
             # Recent activity
-            try:
-                recent_query = """
-                SELECT COUNT(*) as count
-                FROM transactions 
-                WHERE created_at >= NOW() - INTERVAL '7 days'
-                """
-                recent_result = self.db.execute_query(recent_query)
-                recent_count = recent_result[0]['count'] if recent_result else 0
-                
-                response += "🕐 Recent Activity:\n"
-                response += f"  📊 Transactions added (last 7 days): {recent_count}\n"
-                response += "\n"
-            except:
-                pass
+            parts.append("🕐 Recent Activity:\n")
+            parts.append(f"  📊 Transactions added (last 7 days): {health['recent_transactions']}\n")
+            parts.append("\n")
             
             # Health indicators
-            response += "🏥 Health Indicators:\n"
+            parts.append("🏥 Health Indicators:\n")
             
             if health['total_transactions'] == 0:
-                response += "  ⚠️ No transactions in database\n"
-            elif health.get('uncategorized_transactions', 0) > health['total_transactions'] * 0.5:
-                response += "  ⚠️ High number of uncategorized transactions\n"
+                parts.append("  ⚠️ No transactions in database\n")
+            elif health['uncategorized_transactions'] > health['total_transactions'] * 0.5:
+                parts.append("  ⚠️ High number of uncategorized transactions\n")
             else:
-                response += "  ✅ Good categorization coverage\n"
+                parts.append("  ✅ Good categorization coverage\n")
             
-            if health.get('total_vendor_mappings', 0) == 0:
-                response += "  💡 Consider adding vendor mapping rules for automation\n"
+            if health['total_vendor_mappings'] == 0:
+                parts.append("  💡 Consider adding vendor mapping rules for automation\n")
             else:
-                response += "  ✅ Vendor mapping rules configured\n"
+                parts.append("  ✅ Vendor mapping rules configured\n")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error getting database stats: {str(e)}"
@@ -311,101 +380,133 @@ class ManagementTools:
         try:
             from datetime import datetime, timedelta
             
-            # Clear previous duplicate reviews if requested
-            self.db.execute_query("DELETE FROM duplicate_review WHERE reviewed = false")
-            
             # Get recent transactions for duplicate analysis
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=params.days_back)
             
-            transactions_query = """
-            SELECT id, date, description, amount, vendor, account, txn_id, reference
-            FROM transactions 
-            WHERE date >= %s AND date <= %s 
-            AND deleted_at IS NULL
-            ORDER BY date DESC, amount
+            # Bind the tolerance as exact cents so amounts are compared as NUMERIC,
+            # not cast to double precision (inexact, and it defeats the amount index)
+            amount_tolerance = Decimal(round(params.amount_tolerance * 100)) / 100
+            
+            # Candidate pairs come from two self-joins: equal TxnIds, served by
+            # idx_transactions_txn_id_account, UNION the date/amount band, served by
+            # idx_transactions_active_date_amount. recent is NOT MATERIALIZED so each
+            # reference is planned against transactions and its indexes rather than
+            # as a scan of a materialised CTE. Rules are then checked in priority
+            # order: TxnId, Reference, Description, then Vendor.
+            duplicates_query = """
+            WITH recent AS NOT MATERIALIZED (
+                SELECT id, date, description, amount, account, txn_id, reference,
+                       LOWER(description) AS description_key,
+                       LOWER(NULLIF(vendor, '')) AS vendor_key
+                FROM transactions 
+                WHERE date >= %s AND date <= %s 
+                AND deleted_at IS NULL
+                AND (%s OR id NOT IN (
+                    SELECT transaction_id FROM duplicate_review WHERE reviewed = false
+                ))
+            ),
+            candidate_pairs AS (
+                SELECT a.id AS id1, b.id AS id2
+                FROM recent a
+                JOIN recent b ON b.txn_id = a.txn_id AND a.id < b.id
+                WHERE a.txn_id <> '' AND a.account IS NOT DISTINCT FROM b.account
+                UNION
+                SELECT a.id AS id1, b.id AS id2
+                FROM recent a
+                JOIN recent b ON b.date BETWEEN a.date - 3 AND a.date + 3
+                AND b.amount BETWEEN a.amount - %s AND a.amount + %s
+                AND a.id < b.id
+            ),
+            pairs AS (
+                SELECT a.id AS id1, a.date AS date1, a.amount AS amount1, a.description AS description1,
+                       b.id AS id2, b.date AS date2, b.amount AS amount2, b.description AS description2,
+                       ABS(a.date - b.date) AS date_diff,
+                       CASE
+                           WHEN a.txn_id <> '' AND a.txn_id = b.txn_id
+                                AND a.account IS NOT DISTINCT FROM b.account THEN 1
+                           WHEN ABS(a.amount - b.amount) > %s THEN NULL
+                           WHEN a.reference <> '' AND a.reference = b.reference
+                                AND ABS(a.date - b.date) <= 1 THEN 2
+                           WHEN a.description_key = b.description_key
+                                AND ABS(a.date - b.date) <= 3 THEN 3
+                           WHEN a.vendor_key = b.vendor_key
+                                AND ABS(a.date - b.date) <= 2 THEN 4
+                       END AS match_rule
+                FROM candidate_pairs c
+                JOIN recent a ON a.id = c.id1
+                JOIN recent b ON b.id = c.id2
+            ),
+            scored AS (
+                SELECT *,
+                       CASE match_rule
+                           WHEN 1 THEN 1.0
+                           WHEN 2 THEN 0.95
+                           WHEN 3 THEN CASE WHEN date_diff = 0 THEN 0.85 ELSE 0.75 END
+                           ELSE 0.80
+                       END AS similarity_score,
+                       CASE match_rule
+                           WHEN 1 THEN 'Same TxnId and Account'
+                           WHEN 2 THEN 'Same Reference, Date, and Amount'
+                           WHEN 3 THEN 'Same Description and Amount, ' || date_diff || ' days apart'
+                           ELSE 'Same Vendor and Amount, ' || date_diff || ' days apart'
+                       END AS reason
+                FROM pairs
+                WHERE match_rule IS NOT NULL
+            )
+            SELECT n.analyzed, p.last_group, s.*
+            FROM (SELECT COUNT(*) AS analyzed FROM recent) n
+            CROSS JOIN (
+                SELECT COALESCE(MAX(SUBSTRING(group_id FROM 5)::int), 0) AS last_group
+                FROM duplicate_review
+                WHERE NOT %s AND reviewed = false AND group_id ~ '^DUP_[0-9]+$'
+            ) p
+            LEFT JOIN scored s ON true
+            ORDER BY s.date1 DESC, s.id1, s.id2
             """
-            transactions = self.db.execute_query(transactions_query, [start_date, end_date])
-            
-            if len(transactions) < 2:
-                return f"Only {len(transactions)} transactions found in the last {params.days_back} days. Need at least 2 to find duplicates."
+            rows = self.db.execute_query(duplicates_query, [
+                start_date,
+                end_date,
+                params.clear_previous,
+                amount_tolerance,
+                amount_tolerance,
+                amount_tolerance,
+                params.clear_previous
+            ])
+            analyzed_count = rows[0]['analyzed'] if rows else 0
+            # When adding to a pending queue, number new groups after the existing ones
+            last_group = rows[0]['last_group'] if rows else 0
             
-            # Find potential duplicates using similar logic to original
             duplicate_groups = []
-            processed_pairs = set()
-            
-            for i, tx1 in enumerate(transactions):
-                for j, tx2 in enumerate(transactions[i+1:], i+1):
-                    # Skip if already processed this pair
-                    pair_key = tuple(sorted([tx1['id'], tx2['id']]))
-                    if pair_key in processed_pairs:
-                        continue
-                    
-                    # Check if they're potential duplicates
-                    date_diff = abs((tx1['date'] - tx2['date']).days) if tx1['date'] != tx2['date'] else 0
-                    amount_diff = abs(float(tx1['amount']) - float(tx2['amount']))
-                    description_match = tx1['description'].lower() == tx2['description'].lower()
-                    
-                    # Various duplicate criteria
-                    is_duplicate = False
-                    similarity_score = 0.0
-                    reason = ""
-                    
-                    # Exact match (highest confidence)
-                    if (tx1['txn_id'] and tx2['txn_id'] and 
-                        tx1['txn_id'] == tx2['txn_id'] and 
-                        tx1['account'] == tx2['account']):
-                        is_duplicate = True
-                        similarity_score = 1.0
-                        reason = "Same TxnId and Account"
-                    
-                    # Reference + Date + Amount match
-                    elif (tx1['reference'] and tx2['reference'] and 
-                          tx1['reference'] == tx2['reference'] and 
-                          date_diff <= 1 and amount_diff <= params.amount_tolerance):
-                        is_duplicate = True
-                        similarity_score = 0.95
-                        reason = "Same Reference, Date, and Amount"
-                    
-                    # Description + Amount + Close Date
-                    elif (description_match and 
-                          amount_diff <= params.amount_tolerance and 
-                          date_diff <= 3):
-                        is_duplicate = True
-                        similarity_score = 0.85 if date_diff == 0 else 0.75
-                        reason = f"Same Description and Amount, {date_diff} days apart"
-                    
-                    # Vendor + Amount + Close Date (for cleaned up vendors)
-                    elif (tx1.get('vendor') and tx2.get('vendor') and
-                          tx1['vendor'].lower() == tx2['vendor'].lower() and
-                          amount_diff <= params.amount_tolerance and
-                          date_diff <= 2):
-                        is_duplicate = True
-                        similarity_score = 0.80
-                        reason = f"Same Vendor and Amount, {date_diff} days apart"
-                    
-                    if is_duplicate:
-                        group_id = f"DUP_{len(duplicate_groups)+1:04d}"
-                        duplicate_groups.append({
-                            'group_id': group_id,
-                            'transactions': [tx1, tx2],
-                            'similarity_score': similarity_score,
-                            'reason': reason
-                        })
-                        processed_pairs.add(pair_key)
-                        
-                        # If auto-staging high confidence duplicates
-                        if params.auto_stage and similarity_score >= 0.9:
-                            self._stage_duplicate_group(group_id, [tx1, tx2], similarity_score, f"Auto-staged: {reason}")
+            staged_rows = []
             
-            if not duplicate_groups:
-                return f"No potential duplicates found in the last {params.days_back} days.\n\nAnalyzed {len(transactions)} transactions using criteria:\n- Amount tolerance: ${params.amount_tolerance:.2f}\n- Date range: {params.days_back} days"
+            for row in rows:
+                if row['id1'] is None:
+                    continue
+                
+                tx1 = {key: row[f"{key}1"] for key in ('id', 'date', 'amount', 'description')}
+                tx2 = {key: row[f"{key}2"] for key in ('id', 'date', 'amount', 'description')}
+                similarity_score = float(row['similarity_score'])
+                reason = row['reason']
+                
+                group_id = f"DUP_{last_group + len(duplicate_groups) + 1:04d}"
+                duplicate_groups.append({
+                    'group_id': group_id,
+                    'transactions': [tx1, tx2],
+                    'similarity_score': similarity_score,
+                    'reason': reason
+                })
+                
+                # If auto-staging high confidence duplicates
+                if params.auto_stage and similarity_score >= 0.9:
+                    self._stage_duplicate_group(staged_rows, group_id, [tx1, tx2], similarity_score, f"Auto-staged: {reason}")
             
             # Stage all groups for review
             staged_count = 0
             for group in duplicate_groups:
                 if not params.auto_stage or group['similarity_score'] < 0.9:
                     self._stage_duplicate_group(
+                        staged_rows,
                         group['group_id'], 
                         group['transactions'], 
                         group['similarity_score'],
@@ -413,107 +514,138 @@ class ManagementTools:
                     )
                     staged_count += 1
             
-            response = f"🔍 Found {len(duplicate_groups)} potential duplicate groups:\n\n"
+            # Clear the pending queue and stage the new groups atomically, so a
+            # failed insert never leaves the queue emptied
+            with self.db.raw_transaction() as cursor:
+                if params.clear_previous:
+                    cursor.execute("DELETE FROM duplicate_review WHERE reviewed = false")
+                self.db.execute_values("""
+                INSERT INTO duplicate_review 
+                (group_id, transaction_id, similarity_score, notes, reviewed, created_at)
+                VALUES %s
+                """, staged_rows, template="(%s, %s, %s, %s, %s, NOW())", page_size=1000, cursor=cursor)
+            
+            if analyzed_count < 2:
+                return f"Only {analyzed_count} transactions found in the last {params.days_back} days. Need at least 2 to find duplicates."
+            
+            if not duplicate_groups:
+                return f"No potential duplicates found in the last {params.days_back} days.\n\nAnalyzed {analyzed_count} transactions using criteria:\n- Amount tolerance: ${params.amount_tolerance:.2f}\n- Date range: {params.days_back} days"
+            
+            parts = [f"🔍 Found {len(duplicate_groups)} potential duplicate groups:\n\n"]
             
             # Show summary of groups
             for group in duplicate_groups[:10]:  # Show first 10
                 tx1, tx2 = group['transactions']
-                response += f"**{group['group_id']}** (Score: {group['similarity_score']:.0%})\n"
-                response += f"  • Transaction {tx1['id']}: {tx1['date']} | ${tx1['amount']:.2f} | {tx1['description'][:50]}\n"
-                response += f"  • Transaction {tx2['id']}: {tx2['date']} | ${tx2['amount']:.2f} | {tx2['description'][:50]}\n"
-                response += f"  • Reason: {group['reason']}\n\n"
+                parts.append(f"**{group['group_id']}** (Score: {group['similarity_score']:.0%})\n")
+                parts.append(f"  • Transaction {tx1['id']}: {tx1['date']} | ${tx1['amount']:.2f} | {tx1['description'][:50]}\n")
+                parts.append(f"  • Transaction {tx2['id']}: {tx2['date']} | ${tx2['amount']:.2f} | {tx2['description'][:50]}\n")
+                parts.append(f"  • Reason: {group['reason']}\n\n")
             
             if len(duplicate_groups) > 10:
-                response += f"... and {len(duplicate_groups) - 10} more groups.\n\n"
+                parts.append(f"... and {len(duplicate_groups) - 10} more groups.\n\n")
             
             if params.auto_stage:
                 auto_staged = len(duplicate_groups) - staged_count
                 if auto_staged > 0:
-                    response += f"✅ Auto-staged {auto_staged} high-confidence duplicates\n"
+                    parts.append(f"✅ Auto-staged {auto_staged} high-confidence duplicates\n")
             
-            response += f"📋 Staged {staged_count} groups for manual review\n"
-            response += "💡 Use 'get_duplicate_review_queue' to see pending reviews\n"
-            response += "💡 Use 'review_duplicate' to make decisions on each group"
+            parts.append(f"📋 Staged {staged_count} groups for manual review\n")
+            parts.append("💡 Use 'get_duplicate_review_queue' to see pending reviews\n")
+            parts.append("💡 Use 'review_duplicate' to make decisions on each group")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error staging duplicates: {str(e)}"
     
-    def _stage_duplicate_group(self, group_id: str, transactions: List[Dict], similarity_score: float, reason: str):
-        """Helper method to stage a duplicate group for review."""
+    def _stage_duplicate_group(self, staged_rows: List[tuple], group_id: str, transactions: List[Dict], similarity_score: float, reason: str):
+        """Helper method to queue a duplicate group's review rows for a batched insert."""
         for tx in transactions:
-            insert_query = """
-            INSERT INTO duplicate_review 
-            (group_id, transaction_id, similarity_score, notes, reviewed, created_at)
-            VALUES (%s, %s, %s, %s, %s, NOW())
-            """
-            self.db.execute_query(insert_query, [
-                group_id, 
-                tx['id'], 
-                similarity_score, 
-                reason,
-                False
-            ])
+            staged_rows.append((group_id, tx['id'], similarity_score, reason, False))
     
-    def get_duplicate_review_queue(self) -> str:
+    def get_duplicate_review_queue(self, params: Optional[DuplicateReviewQueueParams] = None) -> str:
         """
         Get pending duplicate reviews (replaces Excel Dup Review sheet).
         
-        Shows all duplicate groups that need manual review decisions.
+        Shows duplicate groups that need manual review decisions, one page of
+        groups at a time.
         """
         try:
-            # Get pending reviews grouped by group_id
+            params = params or DuplicateReviewQueueParams()
+            
+            # Get one page of pending groups; rows arrive ordered by group_id
             review_query = """
             SELECT dr.group_id, dr.similarity_score, dr.notes, dr.created_at,
                    t.id, t.date, t.description, t.amount, t.vendor, t.account, t.category
             FROM duplicate_review dr
             JOIN transactions t ON dr.transaction_id = t.id
             WHERE dr.reviewed = false
+            AND dr.group_id IN (
+                SELECT DISTINCT group_id
+                FROM duplicate_review
+                WHERE reviewed = false
+                ORDER BY group_id
+                LIMIT %s OFFSET %s
+            )
             ORDER BY dr.group_id, t.date
             """
-            reviews = self.db.execute_query(review_query)
             
-            if not reviews:
+            # Stream rows from a server-side cursor and write each group as it arrives
+            body = io.StringIO()
+            group_count = 0
+            current_group = None
+            position = 0
+            
+            for review in self.db.stream_query(review_query, [params.limit, params.offset]):
+                if review['group_id'] != current_group:
+                    if current_group is not None:
+                        body.write("---\n\n")
+                    current_group = review['group_id']
+                    group_count += 1
+                    position = 0
+                    body.write(
+                        f"**{current_group}** (Score: {review['similarity_score']:.0%})\n"
+                        f"Reason: {review['notes']}\n"
+                        f"Found: {review['created_at'].strftime('%Y-%m-%d %H:%M')}\n\n"
+                    )
+                
+                position += 1
+                body.write(
+                    f"  {position}. **Transaction {review['id']}**\n"
+                    f"     Date: {review['date']}\n"
+                    f"     Amount: ${review['amount']:.2f}\n"
+                    f"     Description: {review['description']}\n"
+                    f"     Vendor: {review.get('vendor', 'N/A')}\n"
+                    f"     Account: {review['account']}\n"
+                    f"     Category: {review.get('category', 'Uncategorized')}\n\n"
+                )
+            
+            if not group_count and params.offset:
+                # An empty page past the end does not mean the queue itself is empty
+                pending_groups = self.db.execute_query("""
+                SELECT COUNT(DISTINCT group_id) AS pending_groups
+                FROM duplicate_review
+                WHERE reviewed = false
+                """)[0]['pending_groups']
+                if pending_groups:
+                    return (f"📋 No duplicate groups at offset {params.offset}; "
+                            f"{pending_groups} groups are pending.\n\n"
+                            f"💡 Use offset=0 to start from the first page.")
+            
+            if not group_count:
                 return "📋 No pending duplicate reviews!\n\n💡 Use 'stage_duplicates_for_review' to find new potential duplicates."
             
-            # Group by group_id
-            groups = {}
-            for review in reviews:
-                group_id = review['group_id']
-                if group_id not in groups:
-                    groups[group_id] = {
-                        'similarity_score': review['similarity_score'],
-                        'reason': review['notes'],
-                        'created_at': review['created_at'],
-                        'transactions': []
-                    }
-                groups[group_id]['transactions'].append(review)
-            
-            response = f"📋 Duplicate Review Queue ({len(groups)} groups pending):\n\n"
-            
-            for group_id, group_data in groups.items():
-                response += f"**{group_id}** (Score: {group_data['similarity_score']:.0%})\n"
-                response += f"Reason: {group_data['reason']}\n"
-                response += f"Found: {group_data['created_at'].strftime('%Y-%m-%d %H:%M')}\n\n"
-                
-                for i, tx in enumerate(group_data['transactions'], 1):
-                    response += f"  {i}. **Transaction {tx['id']}**\n"
-                    response += f"     Date: {tx['date']}\n"
-                    response += f"     Amount: ${tx['amount']:.2f}\n"
-                    response += f"     Description: {tx['description']}\n"
-                    response += f"     Vendor: {tx.get('vendor', 'N/A')}\n"
-                    response += f"     Account: {tx['account']}\n"
-                    response += f"     Category: {tx.get('category', 'Uncategorized')}\n\n"
-                
-                response += "---\n\n"
+            body.write("---\n\n")
             
-            response += "🎯 **Next Steps:**\n"
-            response += "• Use 'review_duplicate' to make decisions on each group\n"
-            response += "• Actions available: 'keep_both', 'delete_duplicate', 'merge', 'ignore'\n"
-            response += "• Example: review_duplicate(group_id='DUP_0001', action='delete_duplicate', keep_transaction_id=123)"
+            if group_count == params.limit:
+                body.write(f"📄 More groups may be pending. Use offset={params.offset + params.limit} to see the next page.\n\n")
             
-            return response
+            body.write("🎯 **Next Steps:**\n")
+            body.write("• Use 'review_duplicate' to make decisions on each group\n")
+            body.write("• Actions available: 'keep_both', 'delete_duplicate', 'merge', 'ignore'\n")
+            body.write("• Example: review_duplicate(group_id='DUP_0001', action='delete_duplicate', keep_transaction_id=123)")
+            
+            return f"📋 Duplicate Review Queue ({group_count} groups pending):\n\n" + body.getvalue()
             
         except Exception as e:
             return f"Error getting duplicate review queue: {str(e)}"
@@ -549,6 +681,7 @@ class ManagementTools:
             
             # Process the action
             action_result = ""
+            delete_ids = []
             
             if params.action == 'keep_both':
                 # Mark as reviewed but take no action
@@ -564,21 +697,7 @@ class ManagementTools:
                     return f"Error: Transaction ID {params.keep_transaction_id} is not in group '{params.group_id}'. Available IDs: {group_tx_ids}"
                 
                 # Soft delete the other transaction(s)
-                for tx in group_transactions:
-                    if tx['transaction_id'] != params.keep_transaction_id:
-                        delete_query = """
-                        UPDATE transactions 
-                        SET deleted_at = NOW(), 
-                            deletion_reason = %s,
-                            notes = COALESCE(notes || '; ', '') || %s
-                        WHERE id = %s
-                        """
-                        self.db.execute_query(delete_query, [
-                            'duplicate_review', 
-                            f"Duplicate of transaction {params.keep_transaction_id}",
-                            tx['transaction_id']
-                        ])
-                
+                delete_ids = [tx_id for tx_id in group_tx_ids if tx_id != params.keep_transaction_id]
                 action_result = f"🗑️ Soft-deleted duplicate(s), kept transaction {params.keep_transaction_id}"
                 
             elif params.action == 'merge':
@@ -588,47 +707,58 @@ class ManagementTools:
             elif params.action == 'ignore':
                 action_result = f"👁️ Ignored - marked as false positive"
             
-            # Mark the review as completed
-            update_query = """
-            UPDATE duplicate_review 
-            SET reviewed = true, 
-                action_taken = %s,
-                reviewed_by = 'mcp_user',
-                reviewed_at = NOW(),
-                notes = COALESCE(notes || '; ', '') || %s
-            WHERE group_id = %s
-            """
-            self.db.execute_query(update_query, [
-                params.action,
-                f"User decision: {params.notes}" if params.notes else f"Action: {params.action}",
-                params.group_id
-            ])
-            
-            # Log the action
-            log_query = """
+            # Soft delete duplicates, mark the review as completed and log the
+            # action in one atomic statement
+            review_query = """
+            WITH deleted AS (
+                UPDATE transactions 
+                SET deleted_at = NOW(), 
+                    deletion_reason = 'duplicate_review'
+                WHERE id = ANY(%s)
+                RETURNING id
+            ),
+            audited AS (
+                INSERT INTO transaction_audit (transaction_id, action, note)
+                SELECT id, 'soft_delete', %s FROM deleted
+            ),
+            reviewed AS (
+                UPDATE duplicate_review 
+                SET reviewed = true, 
+                    action_taken = %s,
+                    reviewed_by = 'mcp_user',
+                    reviewed_at = NOW(),
+                    notes = COALESCE(notes || '; ', '') || %s
+                WHERE group_id = %s
+                RETURNING id
+            )
             INSERT INTO processing_log (operation_type, source_file, records_processed, status, notes)
             VALUES ('duplicate_review', %s, %s, 'completed', %s)
             """
-            self.db.execute_query(log_query, [
+            self.db.execute_query(review_query, [
+                delete_ids,
+                f"Duplicate of transaction {params.keep_transaction_id}",
+                params.action,
+                f"User decision: {params.notes}" if params.notes else f"Action: {params.action}",
+                params.group_id,
                 f"group_{params.group_id}",
                 len(group_transactions),
                 f"Action: {params.action}; {action_result}"
             ])
             
-            response = f"✅ Reviewed duplicate group '{params.group_id}'\n\n"
-            response += f"**Action taken:** {params.action}\n"
-            response += f"**Result:** {action_result}\n"
+            parts = [f"✅ Reviewed duplicate group '{params.group_id}'\n\n"]
+            parts.append(f"**Action taken:** {params.action}\n")
+            parts.append(f"**Result:** {action_result}\n")
             
             if params.notes:
-                response += f"**Notes:** {params.notes}\n"
+                parts.append(f"**Notes:** {params.notes}\n")
             
-            response += f"\n**Group contained {len(group_transactions)} transactions:**\n"
+            parts.append(f"\n**Group contained {len(group_transactions)} transactions:**\n")
             for tx in group_transactions:
                 status = "KEPT" if (params.action != 'delete_duplicate' or 
                                  tx['transaction_id'] == params.keep_transaction_id) else "DELETED"
-                response += f"• Transaction {tx['transaction_id']} ({status}): {tx['date']} | ${tx['amount']:.2f} | {tx['description'][:50]}\n"
+                parts.append(f"• Transaction {tx['transaction_id']} ({status}): {tx['date']} | ${tx['amount']:.2f} | {tx['description'][:50]}\n")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error reviewing duplicate: {str(e)}"
@@ -640,60 +770,72 @@ class ManagementTools:
         This replaces moving rows to 'Deleted Rows' sheet in Excel.
         """
         try:
-            # Get transaction details first
-            tx_query = "SELECT * FROM transactions WHERE id = %s AND deleted_at IS NULL"
-            transaction = self.db.execute_query(tx_query, [params.transaction_id])
-            
-            if not transaction:
-                return f"Transaction {params.transaction_id} not found or already deleted."
-            
-            tx = transaction[0]
-            
             if params.permanent:
                 # Permanent deletion (use with caution)
-                delete_query = "DELETE FROM transactions WHERE id = %s"
-                self.db.execute_query(delete_query, [params.transaction_id])
+                write_sql = """
+                DELETE FROM transactions 
+                WHERE id = %s AND deleted_at IS NULL
+                RETURNING id, date, amount, description, account
+                """
+                write_params = [params.transaction_id]
+                audit_action = 'delete'
                 action = "permanently deleted"
             else:
                 # Soft delete (recommended)
-                update_query = """
+                write_sql = """
                 UPDATE transactions 
                 SET deleted_at = NOW(), 
-                    deletion_reason = %s,
-                    notes = COALESCE(notes || '; ', '') || %s
-                WHERE id = %s
+                    deletion_reason = %s
+                WHERE id = %s AND deleted_at IS NULL
+                RETURNING id, date, amount, description, account
                 """
-                self.db.execute_query(update_query, [
-                    params.reason,
-                    f"Deleted via MCP: {params.reason}",
-                    params.transaction_id
-                ])
+                write_params = [params.reason, params.transaction_id]
+                audit_action = 'soft_delete'
                 action = "soft deleted"
             
-            # Log the deletion
-            log_query = """
-            INSERT INTO processing_log (operation_type, source_file, records_processed, status, notes)
-            VALUES ('transaction_deletion', %s, 1, 'completed', %s)
+            # Delete, audit and return the deleted row in one round trip; nothing is
+            # written if the transaction was already gone. Soft-deleted rows keep
+            # their own trail, so only permanent deletes go to processing_log.
+            delete_query = f"""
+            WITH target AS ({write_sql}),
+            audited AS (
+                INSERT INTO transaction_audit (transaction_id, action, note)
+                SELECT id, %s, %s FROM target
+            ),
+            logged AS (
+                INSERT INTO processing_log (operation_type, source_file, records_processed, status, notes)
+                SELECT 'transaction_deletion', %s, 1, 'completed', %s FROM target
+                WHERE %s
+            )
+            SELECT * FROM target
             """
-            self.db.execute_query(log_query, [
+            transaction = self.db.execute_query(delete_query, write_params + [
+                audit_action,
+                f"Deleted via MCP: {params.reason}",
                 f"transaction_{params.transaction_id}",
-                f"Reason: {params.reason}; Permanent: {params.permanent}"
+                f"Reason: {params.reason}; Permanent: {params.permanent}",
+                params.permanent
             ])
             
-            response = f"✅ Transaction {params.transaction_id} {action}\n\n"
-            response += f"**Deleted transaction details:**\n"
-            response += f"• Date: {tx['date']}\n"
-            response += f"• Amount: ${tx['amount']:.2f}\n"
-            response += f"• Description: {tx['description']}\n"
-            response += f"• Account: {tx['account']}\n"
-            response += f"• Reason: {params.reason}\n"
+            if not transaction:
+                return f"Transaction {params.transaction_id} not found or already deleted."
+            
+            tx = transaction[0]
+            
+            parts = [f"✅ Transaction {params.transaction_id} {action}\n\n"]
+            parts.append(f"**Deleted transaction details:**\n")
+            parts.append(f"• Date: {tx['date']}\n")
+            parts.append(f"• Amount: ${tx['amount']:.2f}\n")
+            parts.append(f"• Description: {tx['description']}\n")
+            parts.append(f"• Account: {tx['account']}\n")
+            parts.append(f"• Reason: {params.reason}\n")
             
             if not params.permanent:
-                response += f"\n💡 This was a soft delete. The transaction is hidden but can be restored if needed."
+                parts.append(f"\n💡 This was a soft delete. The transaction is hidden but can be restored if needed.")
             else:
-                response += f"\n⚠️ This was a permanent deletion. The transaction cannot be recovered."
+                parts.append(f"\n⚠️ This was a permanent deletion. The transaction cannot be recovered.")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error deleting transaction: {str(e)}"
@@ -705,7 +847,9 @@ class ManagementTools:
         Shows uncategorized transactions that need manual review and categorization.
         """
         try:
-            # Get uncategorized transactions
+            # Get uncategorized transactions. The predicate matches the partial
+            # index idx_transactions_uncategorized_date, so this walks that index
+            # newest-first and stops after 50 rows instead of filtering a seq scan.
             query = """
             SELECT id, date, description, amount, vendor, account, notes
             FROM transactions 
@@ -719,28 +863,28 @@ class ManagementTools:
             if not transactions:
                 return "🎉 All transactions are categorized!\n\nNo uncategorized transactions found."
             
-            response = f"📋 Uncategorized Transactions ({len(transactions)} found):\n\n"
+            parts = [f"📋 Uncategorized Transactions ({len(transactions)} found):\n\n"]
             
             for tx in transactions:
-                response += f"**Transaction {tx['id']}**\n"
-                response += f"• Date: {tx['date']}\n"
-                response += f"• Amount: ${tx['amount']:.2f}\n"
-                response += f"• Description: {tx['description']}\n"
-                response += f"• Vendor: {tx.get('vendor', 'N/A')}\n"
-                response += f"• Account: {tx['account']}\n"
+                parts.append(f"**Transaction {tx['id']}**\n")
+                parts.append(f"• Date: {tx['date']}\n")
+                parts.append(f"• Amount: ${tx['amount']:.2f}\n")
+                parts.append(f"• Description: {tx['description']}\n")
+                parts.append(f"• Vendor: {tx.get('vendor', 'N/A')}\n")
+                parts.append(f"• Account: {tx['account']}\n")
                 if tx.get('notes'):
-                    response += f"• Notes: {tx['notes']}\n"
-                response += "\n"
+                    parts.append(f"• Notes: {tx['notes']}\n")
+                parts.append("\n")
             
             if len(transactions) == 50:
-                response += "... (showing first 50 results)\n\n"
+                parts.append("... (showing first 50 results)\n\n")
             
-            response += "💡 **Next Steps:**\n"
-            response += "• Run AI categorization: Use 'bookkeeping_helper_postgres.py'\n"
-            response += "• Create vendor mappings: Use 'update_vendor_mapping'\n"
-            response += "• Manual categorization: Update transactions directly in database\n"
+            parts.append("💡 **Next Steps:**\n")
+            parts.append("• Run AI categorization: Use 'bookkeeping_helper_postgres.py'\n")
+            parts.append("• Create vendor mappings: Use 'update_vendor_mapping'\n")
+            parts.append("• Manual categorization: Update transactions directly in database\n")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error getting uncategorized transactions: {str(e)}"
@@ -752,7 +896,15 @@ class ManagementTools:
         Analyzes patterns in uncategorized transactions to suggest useful vendor mappings.
         """
         try:
-            # Get frequent uncategorized vendors
+            # Reuse the last suggestions while the uncategorized vendor rows are unchanged
+            fingerprint = self._vendor_suggestion_fingerprint()
+            cached = self._report_cache.get('vendor_suggestions')
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+            
+            # Get frequent uncategorized vendors; the WHERE clause matches the
+            # partial index idx_transactions_uncategorized_vendor, which covers
+            # everything but the sampled descriptions
             query = """
             SELECT vendor, COUNT(*) as transaction_count, 
                    AVG(amount) as avg_amount,
@@ -774,22 +926,24 @@ class ManagementTools:
             if not vendors:
                 return "No vendor mapping suggestions available.\n\nEither all transactions are categorized or vendors need to be cleaned up first."
             
-            response = f"🏪 Vendor Mapping Suggestions ({len(vendors)} vendors):\n\n"
-            response += "These vendors appear frequently in uncategorized transactions:\n\n"
+            parts = [f"🏪 Vendor Mapping Suggestions ({len(vendors)} vendors):\n\n"]
+            parts.append("These vendors appear frequently in uncategorized transactions:\n\n")
             
             for vendor in vendors:
-                response += f"**{vendor['vendor']}**\n"
-                response += f"• Transactions: {vendor['transaction_count']}\n"
-                response += f"• Average Amount: ${vendor['avg_amount']:.2f}\n"
-                response += f"• First Seen: {vendor['first_seen']}\n"
-                response += f"• Last Seen: {vendor['last_seen']}\n"
-                response += f"• Sample Descriptions: {vendor['sample_descriptions'][:100]}...\n"
-                response += f"• **Suggested Command:** `update_vendor_mapping(vendor_pattern='{vendor['vendor']}', category='[CHOOSE CATEGORY]')`\n\n"
-            
-            response += "💡 **Common Categories:**\n"
-            response += "• Groceries, Dining, Gas, Shopping, Utilities, Entertainment, Travel, Healthcare, etc.\n"
-            response += "• Use 'get_categories' to see all available categories\n"
-            
+                parts.append(f"**{vendor['vendor']}**\n")
+                parts.append(f"• Transactions: {vendor['transaction_count']}\n")
+                parts.append(f"• Average Amount: ${vendor['avg_amount']:.2f}\n")
+                parts.append(f"• First Seen: {vendor['first_seen']}\n")
+                parts.append(f"• Last Seen: {vendor['last_seen']}\n")
+                parts.append(f"• Sample Descriptions: {vendor['sample_descriptions'][:100]}...\n")
+                parts.append(f"• **Suggested Command:** `update_vendor_mapping(vendor_pattern='{vendor['vendor']}', category='[CHOOSE CATEGORY]')`\n\n")
+            
+            parts.append("💡 **Common Categories:**\n")
+            parts.append("• Groceries, Dining, Gas, Shopping, Utilities, Entertainment, Travel, Healthcare, etc.\n")
+            parts.append("• Use 'get_categories' to see all available categories\n")
+            
+            response = "".join(parts)
+            self._report_cache['vendor_suggestions'] = (fingerprint, response)
             return response
             
         except Exception as e:
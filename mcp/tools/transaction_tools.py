@@ -5,10 +5,16 @@ Provides transaction-related tools for querying, adding, and managing financial
 """
 
 import hashlib
-from datetime import datetime, date, timedelta
+from decimal import Decimal
+from datetime import date, timedelta
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
+def stable_rowhash(date, description, amount):
+    """Generate a stable hash for a transaction row (must match csv_to_postgres.stable_rowhash)."""
+    s = f"{date}|{description}|{amount}"
+    return hashlib.md5(s.encode()).hexdigest()
+
 class QueryTransactionsParams(BaseModel):
     """Parameters for querying transactions."""
     start_date: Optional[str] = Field(None, description="Start date (YYYY-MM-DD)")
@@ -45,6 +51,7 @@ class TransactionTools:
         """Initialize with database manager."""
         self.db_manager = db_manager
         self.tx_ops = db_manager.get_transaction_operations()
+        self.db = db_manager.get_core_db()
     
     def query_transactions(self, params: QueryTransactionsParams) -> str:
         """
@@ -59,90 +66,69 @@ class TransactionTools:
             end_date_obj = None
             
             if params.start_date:
-                start_date_obj = datetime.strptime(params.start_date, '%Y-%m-%d').date()
+                start_date_obj = date.fromisoformat(params.start_date)
             if params.end_date:
-                end_date_obj = datetime.strptime(params.end_date, '%Y-%m-%d').date()
+                end_date_obj = date.fromisoformat(params.end_date)
+            
+            filters = {
+                'start_date': start_date_obj,
+                'end_date': end_date_obj,
+                'category': params.category,
+                'vendor': params.vendor,
+                'min_amount': Decimal(str(params.min_amount)) if params.min_amount is not None else None,
+                'max_amount': Decimal(str(params.max_amount)) if params.max_amount is not None else None,
+                'description_search': params.description_search
+            }
             
-            # Query transactions from database
+            # Filter, sort and limit in the database so the limit applies to
+            # matching rows rather than truncating before the filters run
             transactions = self.tx_ops.get_transactions(
-                start_date=start_date_obj,
-                end_date=end_date_obj,
-                category=params.category,
-                vendor=params.vendor,
-                limit=params.limit
+                limit=params.limit,
+                sort_by=params.sort_by,
+                sort_order=params.sort_order,
+                **filters
             )
             
-            # Apply additional client-side filters
-            filtered_transactions = []
-            for tx in transactions:
-                # Amount filters
-                if params.min_amount is not None and float(tx['amount']) < params.min_amount:
-                    continue
-                if params.max_amount is not None and float(tx['amount']) > params.max_amount:
-                    continue
-                
-                # Description search
-                if params.description_search:
-                    search_term = params.description_search.lower()
-                    if search_term not in tx['description'].lower():
-                        continue
-                
-                filtered_transactions.append(tx)
-            
-            # Sort results
-            if params.sort_by == "date":
-                filtered_transactions.sort(
-                    key=lambda x: x['date'], 
-                    reverse=(params.sort_order == "desc")
-                )
-            elif params.sort_by == "amount":
-                filtered_transactions.sort(
-                    key=lambda x: float(x['amount']), 
-                    reverse=(params.sort_order == "desc")
-                )
-            elif params.sort_by == "category":
-                filtered_transactions.sort(
-                    key=lambda x: x.get('category', ''), 
-                    reverse=(params.sort_order == "desc")
-                )
-            
             # Format response
-            if not filtered_transactions:
+            if not transactions:
                 return "No transactions found matching the criteria."
             
-            response = f"Found {len(filtered_transactions)} transactions:\n\n"
-            total_amount = sum(float(tx['amount']) for tx in filtered_transactions)
+            # Summary totals cover every matching row, not just the listed page
+            totals = self.tx_ops.get_transaction_totals(**filters)
+            total_amount = totals['total']
             
-            for tx in filtered_transactions:
+            parts = [f"Found {len(transactions)} transactions:\n\n"]
+            
+            for tx in transactions:
                 amount_str = f"${float(tx['amount']):.2f}"
                 if float(tx['amount']) > 0:
                     amount_str = f"+{amount_str}"
                 
-                response += f"• {tx['date']} | {tx['description'][:50]}"
+                parts.append(f"• {tx['date']} | {tx['description'][:50]}")
                 if len(tx['description']) > 50:
-                    response += "..."
-                response += f" | {amount_str}"
+                    parts.append("...")
+                parts.append(f" | {amount_str}")
                 
                 if tx.get('category'):
-                    response += f" | {tx['category']}"
+                    parts.append(f" | {tx['category']}")
                 if tx.get('vendor'):
-                    response += f" | {tx['vendor']}"
-                response += "\n"
+                    parts.append(f" | {tx['vendor']}")
+                parts.append("\n")
             
             # Add summary
-            response += f"\nSummary:"
-            response += f"\n  Count: {len(filtered_transactions)} transactions"
-            response += f"\n  Total: ${total_amount:.2f}"
+            parts.append(f"\nSummary:")
+            parts.append(f"\n  Count: {totals['count']} transactions")
+            if totals['count'] > len(transactions):
+                parts.append(f" (showing first {len(transactions)})")
+            parts.append(f"\n  Total: ${total_amount:.2f}")
             
             if total_amount != 0:
-                income = sum(float(tx['amount']) for tx in filtered_transactions if float(tx['amount']) > 0)
-                expenses = sum(abs(float(tx['amount'])) for tx in filtered_transactions if float(tx['amount']) < 0)
-                if income > 0:
-                    response += f"\n  Income: ${income:.2f}"
-                if expenses > 0:
-                    response += f"\n  Expenses: ${expenses:.2f}"
+                if totals['income'] > 0:
+                    parts.append(f"\n  Income: ${totals['income']:.2f}")
+                if totals['expenses'] > 0:
+                    parts.append(f"\n  Expenses: ${totals['expenses']:.2f}")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error querying transactions: {str(e)}"
@@ -156,13 +142,9 @@ class TransactionTools:
         """
         try:
             # Parse and validate date
-            tx_date = datetime.strptime(params.date, '%Y-%m-%d').date()
+            tx_date = date.fromisoformat(params.date)
             
             # Generate row hash for deduplication
-            def stable_rowhash(date, description, amount):
-                s = f"{date}|{description}|{amount}"
-                return hashlib.md5(s.encode()).hexdigest()
-            
             row_hash = stable_rowhash(tx_date, params.description, params.amount)
             
             # Prepare transaction data
@@ -186,27 +168,27 @@ class TransactionTools:
             # Insert transaction
             tx_id = self.tx_ops.insert_transaction(transaction_data)
             
-            response = f"✅ Transaction added successfully!\n\n"
-            response += f"Transaction ID: {tx_id}\n"
-            response += f"Date: {tx_date}\n"
-            response += f"Description: {params.description}\n"
-            response += f"Amount: ${params.amount:.2f}"
+            parts = [f"✅ Transaction added successfully!\n\n"]
+            parts.append(f"Transaction ID: {tx_id}\n")
+            parts.append(f"Date: {tx_date}\n")
+            parts.append(f"Description: {params.description}\n")
+            parts.append(f"Amount: ${params.amount:.2f}")
             
             if params.amount > 0:
-                response += " (Income)"
+                parts.append(" (Income)")
             else:
-                response += " (Expense)"
+                parts.append(" (Expense)")
             
             if params.category:
-                response += f"\nCategory: {params.category}"
+                parts.append(f"\nCategory: {params.category}")
             if params.vendor:
-                response += f"\nVendor: {params.vendor}"
+                parts.append(f"\nVendor: {params.vendor}")
             if params.account:
-                response += f"\nAccount: {params.account}"
+                parts.append(f"\nAccount: {params.account}")
             if params.notes:
-                response += f"\nNotes: {params.notes}"
+                parts.append(f"\nNotes: {params.notes}")
             
-            return response
+            return "".join(parts)
             
         except ValueError as e:
             return f"Invalid date format. Please use YYYY-MM-DD format. Error: {str(e)}"
@@ -221,72 +203,65 @@ class TransactionTools:
         date proximity, amount similarity, and description matching.
         """
         try:
-            # Get recent transactions for duplicate analysis
+            # Look at the last 30 days of transactions
             end_date = date.today()
-            start_date = end_date - timedelta(days=30)  # Look at last 30 days
+            start_date = end_date - timedelta(days=30)
             
-            transactions = self.tx_ops.get_transactions(
-                start_date=start_date,
-                end_date=end_date
-            )
+            # Bind the tolerance as exact cents so amounts are compared as NUMERIC
+            amount_tolerance = Decimal(round(params.amount_tolerance * 100)) / 100
             
-            # Find potential duplicates
-            potential_duplicates = []
-            checked_pairs = set()
-            
-            for i, tx1 in enumerate(transactions):
-                for j, tx2 in enumerate(transactions[i+1:], i+1):
-                    # Create unique pair identifier
-                    pair_key = tuple(sorted([tx1['id'], tx2['id']]))
-                    if pair_key in checked_pairs:
-                        continue
-                    checked_pairs.add(pair_key)
-                    
-                    # Check similarity criteria
-                    date_diff = abs((tx1['date'] - tx2['date']).days)
-                    amount_diff = abs(float(tx1['amount']) - float(tx2['amount']))
-                    desc_similar = tx1['description'].lower().strip() == tx2['description'].lower().strip()
-                    
-                    # Apply filters
-                    if (date_diff <= params.days_range and 
-                        amount_diff <= params.amount_tolerance and 
-                        desc_similar):
-                        
-                        similarity_score = 1.0 - (date_diff / params.days_range + amount_diff / max(abs(float(tx1['amount'])), 0.01))
-                        potential_duplicates.append({
-                            'tx1': tx1,
-                            'tx2': tx2,
-                            'similarity_score': min(similarity_score, 1.0),
-                            'date_diff': date_diff,
-                            'amount_diff': amount_diff
-                        })
-                        
-                        if len(potential_duplicates) >= params.limit:
-                            break
-                
-                if len(potential_duplicates) >= params.limit:
-                    break
+            # Pair and score in one self-join on the normalised description, which
+            # idx_transactions_lower_desc_date serves; only the top pairs come back
+            duplicates_query = """
+            WITH pairs AS (
+                SELECT t1.id AS id1, t1.date AS date1, t1.description AS description1, t1.amount AS amount1,
+                       t2.id AS id2, t2.date AS date2, t2.description AS description2, t2.amount AS amount2,
+                       ABS(t1.date - t2.date) AS date_diff,
+                       ABS(t1.amount - t2.amount) AS amount_diff
+                FROM transactions t1
+                JOIN transactions t2
+                  ON t1.id < t2.id
+                 AND LOWER(BTRIM(t1.description)) = LOWER(BTRIM(t2.description))
+                 AND t2.date BETWEEN t1.date - %s AND t1.date + %s
+                 AND ABS(t1.amount - t2.amount) <= %s
+                WHERE t1.date BETWEEN %s AND %s AND t1.deleted_at IS NULL
+                  AND t2.date BETWEEN %s AND %s AND t2.deleted_at IS NULL
+            )
+            SELECT *,
+                   LEAST(1.0 - (date_diff::float / GREATEST(%s, 1)
+                                + amount_diff::float / GREATEST(ABS(amount1), 0.01)), 1.0) AS similarity_score
+            FROM pairs
+            ORDER BY similarity_score DESC, date1 DESC, id1
+            LIMIT %s
+            """
+            potential_duplicates = self.db.execute_query(duplicates_query, [
+                params.days_range,
+                params.days_range,
+                amount_tolerance,
+                start_date,
+                end_date,
+                start_date,
+                end_date,
+                params.days_range,
+                params.limit
+            ])
             
             if not potential_duplicates:
                 return f"No potential duplicates found in the last 30 days.\n\nCriteria used:\n- Within {params.days_range} days\n- Amount difference ≤ ${params.amount_tolerance:.2f}\n- Exact description match"
             
-            # Sort by similarity score (highest first)
-            potential_duplicates.sort(key=lambda x: x['similarity_score'], reverse=True)
-            
-            response = f"🔍 Found {len(potential_duplicates)} potential duplicate pairs:\n\n"
+            parts = [f"🔍 Found {len(potential_duplicates)} potential duplicate pairs:\n\n"]
             
             for i, dup in enumerate(potential_duplicates, 1):
-                tx1, tx2 = dup['tx1'], dup['tx2']
                 score = dup['similarity_score']
                 
-                response += f"{i}. Similarity: {score:.2f} | Date diff: {dup['date_diff']} days | Amount diff: ${dup['amount_diff']:.2f}\n"
-                response += f"   A: {tx1['date']} | {tx1['description'][:60]} | ${float(tx1['amount']):.2f} (ID: {tx1['id']})\n"
-                response += f"   B: {tx2['date']} | {tx2['description'][:60]} | ${float(tx2['amount']):.2f} (ID: {tx2['id']})\n\n"
+                parts.append(f"{i}. Similarity: {score:.2f} | Date diff: {dup['date_diff']} days | Amount diff: ${float(dup['amount_diff']):.2f}\n")
+                parts.append(f"   A: {dup['date1']} | {dup['description1'][:60]} | ${float(dup['amount1']):.2f} (ID: {dup['id1']})\n")
+                parts.append(f"   B: {dup['date2']} | {dup['description2'][:60]} | ${float(dup['amount2']):.2f} (ID: {dup['id2']})\n\n")
             
-            response += "💡 Review these transactions and remove duplicates manually if confirmed.\n"
-            response += "Note: This analysis looks at the last 30 days of transactions."
+            parts.append("💡 Review these transactions and remove duplicates manually if confirmed.\n")
+            parts.append("Note: This analysis looks at the last 30 days of transactions.")
             
-            return response
+            return "".join(parts)
             
         except Exception as e:
             return f"Error finding duplicates: {str(e)}"
\ No newline at end of file
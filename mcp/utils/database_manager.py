@@ -41,21 +41,25 @@ class DatabaseManager:
     def test_connection(self):
         """Test database connection and return basic stats."""
         try:
-            # Test basic query
-            result = self.db.execute_query("SELECT version();")
-            postgres_version = result[0]['version'] if result else 'Unknown'
-            
-            # Get basic counts
-            total_transactions = self.db.get_table_row_count('transactions')
-            total_categories = self.db.get_table_row_count('categories')
-            total_vendor_mappings = self.db.get_table_row_count('vendor_mappings')
+            # Version and basic counts in one round trip. The transactions figure
+            # is only the planner's estimate (pg_class.reltuples, NULL until the
+            # table is first analysed) so the check never scans the large table;
+            # the small lookup tables are counted exactly.
+            result = self.db.execute_query("""
+            SELECT version() AS version,
+                   (SELECT CASE WHEN reltuples >= 0 THEN reltuples::bigint END FROM pg_class
+                    WHERE oid = to_regclass('public.transactions')) AS estimated_transactions,
+                   (SELECT COUNT(*) FROM categories) AS total_categories,
+                   (SELECT COUNT(*) FROM vendor_mappings) AS total_vendor_mappings
+            """)
+            stats = result[0] if result else {}
             
             return {
                 'connected': True,
-                'postgres_version': postgres_version,
-                'total_transactions': total_transactions,
-                'total_categories': total_categories,
-                'total_vendor_mappings': total_vendor_mappings
+                'postgres_version': stats.get('version', 'Unknown'),
+                'estimated_transactions': stats.get('estimated_transactions'),
+                'total_categories': stats.get('total_categories'),
+                'total_vendor_mappings': stats.get('total_vendor_mappings')
             }
         except Exception as e:
             return {
@@ -69,24 +73,36 @@ class DatabaseManager:
             health = self.test_connection()
             
             if health['connected']:
-                # Add more detailed health checks
-                uncategorized_count = len(self.tx_ops.get_uncategorized_transactions(limit=1))
-                
-                # Get date range of transactions
-                date_range_query = """
-                SELECT MIN(date) as earliest, MAX(date) as latest, COUNT(*) as total
-                FROM transactions WHERE date IS NOT NULL
-                """
-                date_info = self.db.execute_query(date_range_query)
+                # Uncategorized probe, date range and table existence in one query
+                details = self.db.execute_query("""
+                SELECT (SELECT COUNT(*) FROM (
+                            SELECT 1 FROM transactions
+                            WHERE category IS NULL OR category = ''
+                            LIMIT 1
+                        ) u) AS uncategorized,
+                       d.earliest, d.latest, d.total,
+                       to_regclass('public.transactions') IS NOT NULL AS has_transactions,
+                       to_regclass('public.categories') IS NOT NULL AS has_categories,
+                       to_regclass('public.vendor_mappings') IS NOT NULL AS has_vendor_mappings,
+                       to_regclass('public.processing_log') IS NOT NULL AS has_processing_log
+                FROM (
+                    SELECT MIN(date) as earliest, MAX(date) as latest, COUNT(*) as total
+                    FROM transactions WHERE date IS NOT NULL
+                ) d
+                """)[0]
                 
                 health.update({
-                    'uncategorized_transactions': uncategorized_count,
-                    'date_range': date_info[0] if date_info else None,
+                    'uncategorized_transactions': details['uncategorized'],
+                    'date_range': {
+                        'earliest': details['earliest'],
+                        'latest': details['latest'],
+                        'total': details['total']
+                    },
                     'tables_exist': {
-                        'transactions': self.db.table_exists('transactions'),
-                        'categories': self.db.table_exists('categories'),
-                        'vendor_mappings': self.db.table_exists('vendor_mappings'),
-                        'processing_log': self.db.table_exists('processing_log')
+                        'transactions': details['has_transactions'],
+                        'categories': details['has_categories'],
+                        'vendor_mappings': details['has_vendor_mappings'],
+                        'processing_log': details['has_processing_log']
                     }
                 })
             
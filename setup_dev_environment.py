@@ -6,46 +6,48 @@ Setup script for the AI Bookkeeping development environment.
 Installs dependencies and sets up database configuration.
 """
 
+import argparse
+import hashlib
 import os
+import shutil
+import string
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a shell command and handle errors."""
-    print(f"🔧 {description}...")
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed")
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e}")
-        print(f"Error output: {e.stderr}")
-        return None
+# Persistent pip cache so repeated developer setups reuse built wheels
+PIP_CACHE_DIR = Path.home() / ".cache" / "bookkeeping-pip"
 
-def install_python_dependencies():
-    """Install Python dependencies."""
-    requirements_file = Path(__file__).parent / "requirements.txt"
-    if requirements_file.exists():
-        cmd = f"{sys.executable} -m pip install -r {requirements_file}"
-        return run_command(cmd, "Installing Python dependencies")
-    else:
-        print("❌ requirements.txt not found")
-        return None
+# Local wheelhouse that pip install reads from once pip download has filled it
+WHEELHOUSE_DIR = Path.home() / ".cache" / "bookkeeping-wheels"
 
-def create_env_file():
-    """Create a sample .env file for database configuration."""
-    env_file = Path(__file__).parent / ".env.example"
-    env_content = """# AI Bookkeeping Database Configuration
+# Records the requirements installed into this interpreter's environment
+REQUIREMENTS_MARKER = Path(sys.prefix) / ".requirements.sha256"
+
+# Placeholder connection settings for the (tracked) sample .env file; these
+# match DatabaseConfig's defaults and are only overridden by explicit --db-*
+# options, never read from the local environment
+_ENV_DEFAULTS = {
+    "host": "localhost",
+    "port": "5432",
+    "database": "bookkeeping",
+    "user": "bookkeeper",
+    "sslmode": "prefer",
+}
+
+# Template for the sample .env file written by create_env_file
+_ENV_TEMPLATE = string.Template("""# AI Bookkeeping Database Configuration
 # Copy this to .env and update with your settings
 
 # PostgreSQL Connection
-POSTGRES_HOST=localhost
-POSTGRES_PORT=5432
-POSTGRES_DB=bookkeeping
-POSTGRES_USER=bookkeeper
+POSTGRES_HOST=$host
+POSTGRES_PORT=$port
+POSTGRES_DB=$database
+POSTGRES_USER=$user
 POSTGRES_PASSWORD=password
-POSTGRES_SSLMODE=prefer
+POSTGRES_SSLMODE=$sslmode
 
 # OpenAI API (for existing categorization features)
 OPENAI_API_KEY=your_openai_api_key_here
@@ -56,11 +58,161 @@ BOOKKEEPING_CSV_PATH=/path/to/csv/files
 # Development Settings
 DEBUG=true
 LOG_LEVEL=INFO
-"""
+""")
+
+def _resolve_argv(argv):
+    """Return argv with its program resolved to an absolute path where possible.
+    
+    subprocess only takes the posix_spawn() fast path for an absolute executable
+    and no cwd. On Python 3.13+ that includes the default close_fds=True where
+    the C library supports posix_spawn_file_actions_addclosefrom_np (glibc 2.34+).
+    """
+    argv = list(argv)
+    program = shutil.which(argv[0])
+    if program is not None:
+        argv[0] = program
+    return argv
+
+def run_command(argv, description, stream=False, cwd=None, input=None):
+    """Run a command (argv list, no shell) and handle errors.
+    
+    With stream=True the command's output goes straight to the terminal
+    instead of being buffered, and an empty string is returned on success.
+    input, if given, is fed to the command's stdin.
+    """
+    print(f"🔧 {description}...")
+    try:
+        if stream:
+            subprocess.run(_resolve_argv(argv), check=True, cwd=cwd, input=input)
+            print(f"✅ {description} completed")
+            return ""
+        result = subprocess.run(_resolve_argv(argv), check=True, capture_output=True, text=True,
+                                cwd=cwd, input=input)
+        print(f"✅ {description} completed")
+        return result.stdout
+    except subprocess.CalledProcessError as e:
+        print(f"❌ {description} failed: {e}")
+        if e.stderr:
+            print(f"Error output: {e.stderr}")
+        return None
+    except FileNotFoundError:
+        print(f"❌ {description} failed: {argv[0]} not found")
+        return None
+
+def _detect_manager(root):
+    """Pick the dependency manager for root: "uv", "poetry" or "pip" (None if nothing to install).
     
+    Lock files win over requirements.txt, but only when their tool is on PATH.
+    """
+    if (root / "uv.lock").exists() and shutil.which("uv"):
+        return "uv"
+    if (root / "poetry.lock").exists() and shutil.which("poetry"):
+        return "poetry"
+    if (root / "requirements.txt").exists():
+        return "pip"
+    return None
+
+def _requirements_digest(requirements):
+    """Hash requirements.txt contents together with the interpreter they are installed into."""
+    digest = hashlib.sha256(sys.executable.encode())
+    digest.update(requirements)
+    return digest.hexdigest()
+
+def _requirements_up_to_date(requirements):
+    """Check whether these requirements were already installed into this environment."""
+    try:
+        return REQUIREMENTS_MARKER.read_text().strip() == _requirements_digest(requirements)
+    except OSError:
+        return False
+
+def _record_requirements(requirements):
+    """Atomically record the installed requirements hash (best effort)."""
+    tmp_marker = REQUIREMENTS_MARKER.with_suffix(".tmp")
+    try:
+        tmp_marker.write_text(_requirements_digest(requirements))
+        os.replace(tmp_marker, REQUIREMENTS_MARKER)
+    except OSError as e:
+        print(f"⚠️  Could not record requirements hash: {e}")
+
+def _pip_requirements(pip_command, requirements, pip_args, description):
+    """Run pip <pip_command> -r with requirements (bytes) already in memory.
+    
+    The contents are piped through /dev/stdin so pip never re-opens the file;
+    Windows has no /dev/stdin, so a temporary copy is used there instead.
+    """
+    argv = [sys.executable, "-m", "pip", pip_command, *pip_args, "-r"]
+    if os.name != "nt":
+        return run_command(argv + ["/dev/stdin"], description, stream=True, input=requirements)
+    
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
+        tmp.write(requirements)
     try:
-        with open(env_file, 'w') as f:
-            f.write(env_content)
+        return run_command(argv + [tmp.name], description, stream=True)
+    finally:
+        os.unlink(tmp.name)
+
+def install_python_dependencies():
+    """Install Python dependencies."""
+    root = Path(__file__).parent
+    requirements_file = root / "requirements.txt"
+    manager = _detect_manager(root)
+    
+    if manager == "uv":
+        return run_command(["uv", "sync"], "Installing Python dependencies with uv",
+                           stream=True, cwd=root)
+    elif manager == "poetry":
+        return run_command(["poetry", "install", "--no-root"], "Installing Python dependencies with poetry",
+                           stream=True, cwd=root)
+    elif manager == "pip":
+        requirements = requirements_file.read_bytes()
+        if _requirements_up_to_date(requirements):
+            print("✅ Python dependencies up-to-date")
+            return ""
+        
+        # A current pip with wheel installed can reuse cached wheels instead of rebuilding
+        run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip", "wheel"],
+                    "Upgrading pip and wheel")
+        
+        # Fetch everything into the wheelhouse first (files already there are
+        # reused), then install purely from it without touching the index
+        downloaded = _pip_requirements(
+            "download", requirements,
+            ["--prefer-binary", "--cache-dir", str(PIP_CACHE_DIR), "-d", str(WHEELHOUSE_DIR)],
+            "Downloading Python dependencies")
+        
+        result = None
+        if downloaded is not None:
+            result = _pip_requirements(
+                "install", requirements, ["--no-index", "--find-links", str(WHEELHOUSE_DIR)],
+                "Installing Python dependencies from the wheelhouse")
+        
+        # sdists may need build requirements that pip download never fetched, so
+        # fall back to the index, still preferring anything in the wheelhouse
+        if result is None:
+            print("💡 Installing from the package index instead")
+            result = _pip_requirements(
+                "install", requirements,
+                ["--prefer-binary", "--cache-dir", str(PIP_CACHE_DIR), "--find-links", str(WHEELHOUSE_DIR)],
+                "Installing Python dependencies")
+        if result is not None:
+            _record_requirements(requirements)
+        return result
+    else:
+        print("❌ requirements.txt not found")
+        return None
+
+def create_env_file(overrides=None):
+    """Create a sample .env file for database configuration.
+    
+    overrides maps _ENV_DEFAULTS keys to values that replace the placeholders.
+    """
+    env_file = Path(__file__).parent / ".env.example"
+    if env_file.exists():
+        print(f"✅ {env_file} already exists")
+        return
+    
+    try:
+        env_file.write_text(_ENV_TEMPLATE.substitute(_ENV_DEFAULTS, **(overrides or {})))
         print(f"✅ Created {env_file}")
         print("📝 Copy .env.example to .env and update with your settings")
     except Exception as e:
@@ -68,44 +220,92 @@ LOG_LEVEL=INFO
 
 def check_postgresql():
     """Check if PostgreSQL is available."""
-    # Try to find psql command
-    psql_check = run_command("which psql", "Checking for PostgreSQL client")
-    if psql_check:
+    # Try to find psql command on PATH
+    print("🔧 Checking for PostgreSQL client...")
+    psql_path = shutil.which("psql")
+    if psql_path is not None:
         print("✅ PostgreSQL client found")
         
         # Try to connect (this might fail if not configured)
         print("💡 To test database connection later, run: python -m database")
     else:
-        print("⚠️  PostgreSQL client not found")
-        print("💡 Install PostgreSQL or connect to an existing instance")
-        print("💡 For local development, consider using Docker:")
-        print("   docker run -d --name bookkeeping-postgres \\")
-        print("     -e POSTGRES_DB=bookkeeping \\")
-        print("     -e POSTGRES_USER=bookkeeper \\")
-        print("     -e POSTGRES_PASSWORD=password \\")
-        print("     -p 5432:5432 postgres:15")
+        # One write keeps the hint together while the other setup steps print
+        sys.stdout.write("\n".join([
+            "⚠️  PostgreSQL client not found",
+            "💡 Install PostgreSQL or connect to an existing instance",
+            "💡 For local development, consider using Docker:",
+            "   docker run -d --name bookkeeping-postgres \\",
+            "     -e POSTGRES_DB=bookkeeping \\",
+            "     -e POSTGRES_USER=bookkeeper \\",
+            "     -e POSTGRES_PASSWORD=password \\",
+            "     -p 5432:5432 postgres:15",
+        ]) + "\n")
+
+def _already_set_up(root):
+    """Check whether .env.example exists, pip requirements are installed and psql is on PATH.
+    
+    Only pip installs record a requirements hash, so uv and poetry setups always
+    run in full.
+    """
+    env_ok = (root / ".env.example").exists()
+    deps_ok = (_detect_manager(root) == "pip"
+               and _requirements_up_to_date((root / "requirements.txt").read_bytes()))
+    psql_ok = shutil.which("psql") is not None
+    return env_ok and deps_ok and psql_ok
 
 def main():
     """Main setup function."""
-    print("🚀 Setting up AI Bookkeeping development environment...")
+    parser = argparse.ArgumentParser(description="Set up the AI Bookkeeping development environment")
+    parser.add_argument("--force", action="store_true",
+                       help="Run every setup step even if the environment looks configured")
+    parser.add_argument("--db-host", help=f"POSTGRES_HOST for .env.example (default: {_ENV_DEFAULTS['host']})")
+    parser.add_argument("--db-port", help=f"POSTGRES_PORT for .env.example (default: {_ENV_DEFAULTS['port']})")
+    parser.add_argument("--db-name", help=f"POSTGRES_DB for .env.example (default: {_ENV_DEFAULTS['database']})")
+    parser.add_argument("--db-user", help=f"POSTGRES_USER for .env.example (default: {_ENV_DEFAULTS['user']})")
+    parser.add_argument("--db-sslmode", help=f"POSTGRES_SSLMODE for .env.example (default: {_ENV_DEFAULTS['sslmode']})")
+    args = parser.parse_args()
+    
+    env_overrides = {key: value for key, value in (
+        ("host", args.db_host),
+        ("port", args.db_port),
+        ("database", args.db_name),
+        ("user", args.db_user),
+        ("sslmode", args.db_sslmode),
+    ) if value is not None}
     
-    # Install dependencies
-    install_python_dependencies()
+    if not args.force and _already_set_up(Path(__file__).parent):
+        print("✅ Development environment already set up (use --force to re-run setup)")
+        return
     
-    # Create environment configuration
-    create_env_file()
+    print("🚀 Setting up AI Bookkeeping development environment...")
     
-    # Check PostgreSQL
-    check_postgresql()
+    # Install dependencies, create environment configuration and check
+    # PostgreSQL side by side; the steps are independent and pip dominates
+    steps = [
+        (install_python_dependencies, ()),
+        (create_env_file, (env_overrides,)),
+        (check_postgresql, ()),
+    ]
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = {executor.submit(step, *step_args): step.__name__ for step, step_args in steps}
+        wait(futures)
     
-    print("\n📋 Next steps:")
-    print("1. Copy .env.example to .env and update database settings")
-    print("2. Set up PostgreSQL database (local or remote)")
-    print("3. Run: python -m database --migrate")
-    print("4. Run: python -m database --test-connection")
-    print("5. Start importing CSV data with: python csv_to_postgres.py")
+    for future, name in futures.items():
+        if future.exception() is not None:
+            print(f"❌ {name} raised an error: {future.exception()}")
     
-    print("\n✨ Development environment setup complete!")
+    sys.stdout.write("\n".join([
+        "",
+        "📋 Next steps:",
+        "1. Copy .env.example to .env and update database settings",
+        "2. Set up PostgreSQL database (local or remote)",
+        "3. Run: python -m database --migrate",
+        "4. Run: python -m database --test-connection",
+        "5. Start importing CSV data with: python csv_to_postgres.py",
+        "",
+        "✨ Development environment setup complete!",
+    ]) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
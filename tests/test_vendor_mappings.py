@@ -0,0 +1,53 @@
+"""
+Tests for vendor mapping rule matching.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("psycopg2")
+pytest.importorskip("pandas")
+
+from database.database import VendorMappingOperations
+
+
+class StaticVendorMappings(VendorMappingOperations):
+    """Vendor mapping operations over a fixed rule list instead of the database."""
+
+    def __init__(self, mappings):
+        super().__init__(db_manager=None)
+        self.mappings = mappings
+
+    def get_vendor_mappings(self):
+        return self.mappings
+
+
+def _mapping(mapping_id, pattern, category, is_regex=True):
+    return {'id': mapping_id, 'vendor_pattern': pattern, 'category': category, 'is_regex': is_regex}
+
+
+def test_backreference_rule_matches_despite_union_miss():
+    """A rule with a numbered backreference still matches when other rules precede it."""
+    ops = StaticVendorMappings([
+        _mapping(1, r'(xyz)q', 'First'),
+        _mapping(2, r'(a)\1', 'Doubled'),
+    ])
+
+    assert ops.find_category_for_vendor('aa') == 'Doubled'
+
+
+def test_priority_order_is_kept():
+    """The first rule in priority order wins, whether or not it is in the union."""
+    ops = StaticVendorMappings([
+        _mapping(1, r'(shell)', 'Grouped'),
+        _mapping(2, 'shell', 'Plain', is_regex=False),
+    ])
+
+    assert ops.find_category_for_vendor('Shell Oil 123') == 'Grouped'
+    assert ops.find_category_for_vendor('Unknown vendor') is None